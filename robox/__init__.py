@@ -0,0 +1,7 @@
+import importlib.metadata
+
+try:
+    __version__ = importlib.metadata.version('robox.io')
+except importlib.metadata.PackageNotFoundError:
+    # Running from a source tree that was not installed.
+    __version__ = 'unknown'
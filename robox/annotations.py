@@ -22,7 +22,7 @@ def _get_language_default():
 
 def _get_problem_options():
     options = set()
-    all_problems = metadata.find_problems()
+    all_problems = metadata.find_problem_summaries()
     for problem in all_problems:
         options.add(problem.code)
         options.update(problem.aliases)
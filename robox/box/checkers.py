@@ -16,6 +16,22 @@ from robox.grading.steps import (
     RunLog,
 )
 
+# Paths of the files passed to the checker inside the sandbox.
+_INPUT_PATH = pathlib.PosixPath('input.txt')
+_EXPECTED_PATH = pathlib.PosixPath('expected.txt')
+_OUTPUT_PATH = pathlib.PosixPath('output.txt')
+_CHECKER_ARGS = f'{_INPUT_PATH} {_OUTPUT_PATH} {_EXPECTED_PATH}'
+
+# Outcomes for runs that finished before the checker needs to be called.
+_EXIT_STATUS_TO_OUTCOME = {
+    SandboxBase.EXIT_SIGNAL: Outcome.RUNTIME_ERROR,
+    SandboxBase.EXIT_NONZERO_RETURN: Outcome.RUNTIME_ERROR,
+    SandboxBase.EXIT_TIMEOUT: Outcome.TIME_LIMIT_EXCEEDED,
+    SandboxBase.EXIT_TIMEOUT_WALL: Outcome.TIME_LIMIT_EXCEEDED,
+    SandboxBase.EXIT_MEMORY_LIMIT_EXCEEDED: Outcome.MEMORY_LIMIT_EXCEEDED,
+    SandboxBase.EXIT_SANDBOX_ERROR: Outcome.INTERNAL_ERROR,
+}
+
 
 def compile_checker() -> str:
     checker = package.get_checker()
@@ -42,28 +58,23 @@ def check(
     if run_log.time is not None and run_log.time * 1000 > pkg.timeLimit * 2:
         return CheckerResult(outcome=Outcome.TIME_LIMIT_EXCEEDED)
 
-    if run_log.exitstatus in [SandboxBase.EXIT_SIGNAL, SandboxBase.EXIT_NONZERO_RETURN]:
-        return CheckerResult(outcome=Outcome.RUNTIME_ERROR)
-    if run_log.exitstatus in [SandboxBase.EXIT_TIMEOUT, SandboxBase.EXIT_TIMEOUT_WALL]:
-        return CheckerResult(outcome=Outcome.TIME_LIMIT_EXCEEDED)
-    if run_log.exitstatus == SandboxBase.EXIT_MEMORY_LIMIT_EXCEEDED:
-        return CheckerResult(outcome=Outcome.MEMORY_LIMIT_EXCEEDED)
-    if run_log.exitstatus == SandboxBase.EXIT_SANDBOX_ERROR:
-        return CheckerResult(outcome=Outcome.INTERNAL_ERROR)
+    outcome = _EXIT_STATUS_TO_OUTCOME.get(run_log.exitstatus)
+    if outcome is not None:
+        return CheckerResult(outcome=outcome)
 
     error = DigestHolder()
     inputs = [
         GradingFileInput(
             src=testcase.inputPath,
-            dest=pathlib.PosixPath('input.txt'),
+            dest=_INPUT_PATH,
         ),
         GradingFileInput(
             src=testcase.outputPath,
-            dest=pathlib.PosixPath('expected.txt'),
+            dest=_EXPECTED_PATH,
         ),
         GradingFileInput(
             src=program_output,
-            dest=pathlib.PosixPath('output.txt'),
+            dest=_OUTPUT_PATH,
         ),
     ]
     checker_run_log = run_item(
@@ -71,10 +82,10 @@ def check(
         DigestOrSource.create(checker_digest),
         stderr=DigestOrDest.create(error),
         inputs=inputs,
-        extra_args='input.txt output.txt expected.txt',
+        extra_args=_CHECKER_ARGS,
     )
 
-    if checker_run_log is None or checker_run_log.exitcode not in [0, 1, 2, 3]:
+    if checker_run_log is None or not 0 <= checker_run_log.exitcode <= 3:
         return CheckerResult(outcome=Outcome.INTERNAL_ERROR)
 
     message = package.get_digest_as_string(error.value or '') or ''
@@ -1,3 +1,4 @@
+import fcntl
 import os
 import pathlib
 import shutil
@@ -9,6 +10,22 @@ from robox import testing_utils
 from robox.box import package
 
 
+def _clone_or_copy(src: str, dst: str) -> str:
+    # Tests are allowed to modify the package files, so hardlinking testdata is
+    # not an option. Reflinks are copy-on-write, so try those first, where the
+    # Linux ioctl to make a file share the data blocks of another is known.
+    if not hasattr(fcntl, 'FICLONE'):
+        shutil.copy2(src, dst)
+        return dst
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), fcntl.FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 @pytest.fixture
 def pkg_cleandir(cleandir: pathlib.Path) -> Iterator[pathlib.Path]:
     old_temp_dir = package.TEMP_DIR
@@ -33,10 +50,27 @@ def pkg_from_testdata(
     if marker is None:
         raise ValueError('test_pkg marker not found')
     testdata = testdata_path / marker.args[0]
-    shutil.copytree(str(testdata), str(pkg_cleandir), dirs_exist_ok=True)
+    shutil.copytree(
+        str(testdata),
+        str(pkg_cleandir),
+        dirs_exist_ok=True,
+        copy_function=_clone_or_copy,
+    )
     yield pkg_cleandir
 
 
-@pytest.fixture(autouse=True)
-def clear_cache():
+@pytest.fixture(autouse=True, scope='session')
+def clear_session_cache():
     testing_utils.clear_all_functools_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(request):
+    # Only tests that depend on the working directory or on the config need
+    # a clean cache.
+    if (
+        request.node.get_closest_marker('uses_config_cache') is not None
+        or request.node.get_closest_marker('test_pkg') is not None
+        or 'pkg_cleandir' in request.fixturenames
+    ):
+        testing_utils.clear_all_functools_cache()
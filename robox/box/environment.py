@@ -1,18 +1,20 @@
-import functools
+import dataclasses
 import pathlib
 from enum import Enum
 from typing import Annotated, Any, Dict, List, Optional, Type, TypeVar
 
 import typer
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
-from robox import config, console, utils
+from robox import cache_utils, config, console, utils
 from robox.grading.judge.sandbox import SandboxBase, SandboxParams
 from robox.grading.judge.sandboxes.isolate import IsolateSandbox
 from robox.grading.judge.sandboxes.stupid_sandbox import StupidSandbox
 
 T = TypeVar('T', bound=BaseModel)
 
+_CACHE: Dict[Any, Any] = {}
+
 
 class VerificationLevel(Enum):
     NONE = 0
@@ -81,12 +83,12 @@ class EnvironmentSandbox(BaseModel):
     preserveEnv: Optional[bool] = False
 
     # Directories in the host that should be read-only exposed to the sandbox.
-    mirrorDirs: Optional[List[str]] = []
+    mirrorDirs: Optional[List[str]] = Field(default_factory=list)
 
 
 class CompilationConfig(BaseModel):
     # Commands to compile the program.
-    commands: Optional[List[str]] = []
+    commands: Optional[List[str]] = Field(default_factory=list)
 
     # Sandbox configuration to use when compiling for this language.
     sandbox: Optional[EnvironmentSandbox] = None
@@ -127,6 +129,17 @@ class EnvironmentLanguage(BaseModel):
     fileMapping: Optional[FileMapping] = None
 
 
+class _EnvironmentLanguageJsonSchema:
+    # Publishes the schema of `EnvironmentLanguage` for raw languages, so
+    # editors still validate them.
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        return handler(EnvironmentLanguage.__pydantic_core_schema__)
+
+
+RawEnvironmentLanguage = Annotated[Dict[str, Any], _EnvironmentLanguageJsonSchema]
+
+
 class Environment(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
@@ -142,8 +155,10 @@ class Environment(BaseModel):
     # execution config can be individually overridden in the language configuration.
     defaultExecution: Optional[ExecutionConfig] = None
 
-    # Configuration for each language supported in this environment.
-    languages: List[EnvironmentLanguage] = []
+    # Configuration for each language supported in this environment. Kept raw
+    # and only validated as an `EnvironmentLanguage` when requested through
+    # `get_language`, since usually a single language is used at a time.
+    languages: List[RawEnvironmentLanguage] = Field(default_factory=list)
 
     # Identifier of the sandbox used by this environment (e.g. "stupid", "isolate")
     sandbox: str = 'stupid'
@@ -152,14 +167,58 @@ class Environment(BaseModel):
     preset: str = 'default'
 
     # Extensions to be added to the environment.
-    extensions: Dict[str, Any] = {}
+    extensions: Dict[str, Any] = Field(default_factory=dict)
+
+    @field_validator('languages')
+    @classmethod
+    def _check_language_names(
+        cls, languages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # Languages are looked up by name, so at least that is checked early.
+        for i, language in enumerate(languages):
+            if not isinstance(language.get('name'), str):
+                raise ValueError(f'language at index {i} has no name')
+        return languages
 
 
 def get_environment_path(env: str) -> pathlib.Path:
     return config.get_app_file(pathlib.PosixPath('envs') / f'{env}.rbx.yml')
 
 
-@functools.cache
+def _get_environment_cache_path(env_path: pathlib.Path) -> pathlib.Path:
+    return env_path.with_name(f'{env_path.name}.cache.json')
+
+
+def _load_environment(env_path: pathlib.Path) -> Environment:
+    # Parsing YAML is slow, so we keep a JSON dump of the validated environment
+    # next to it, which is reused for as long as the YAML is not modified.
+    cache_path = _get_environment_cache_path(env_path)
+    try:
+        if cache_path.stat().st_mtime_ns >= env_path.stat().st_mtime_ns:
+            return Environment.model_validate_json(cache_path.read_bytes())
+    except (OSError, ValidationError):
+        pass
+
+    try:
+        environment = utils.model_from_yaml(Environment, env_path.read_bytes())
+    except ValidationError as e:
+        console.console.print(
+            f'[error]Environment file [item]{env_path}[/item] is invalid:[/error]'
+        )
+        console.console.print(e, markup=False)
+        raise typer.Exit(1) from None
+    try:
+        # Only dump fields that were explicitly set, since merging configs
+        # relies on knowing which fields were overridden.
+        utils.write_atomically(
+            cache_path, environment.model_dump_json(exclude_unset=True).encode()
+        )
+    except OSError:
+        pass
+    return environment
+
+
+@cache_utils.memoize(_CACHE)
 def get_environment(env: Optional[str] = None) -> Environment:
     env_path = get_environment_path(env or config.get_config().boxEnvironment)
     if not env_path.is_file():
@@ -167,39 +226,53 @@ def get_environment(env: Optional[str] = None) -> Environment:
             f'Environment file [item]{env_path}[/item] not found.', style='error'
         )
         raise typer.Exit()
-    return utils.model_from_yaml(Environment, env_path.read_text())
+    return _load_environment(env_path)
+
+
+@cache_utils.memoize(_CACHE)
+def _get_language_index() -> Dict[str, Dict[str, Any]]:
+    # Reversed, so the first language declared with a given name wins.
+    return {lang.get('name'): lang for lang in reversed(get_environment().languages)}
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_language(name: str) -> EnvironmentLanguage:
-    for lang in get_environment().languages:
-        if lang.name == name:
-            return lang
+    lang = _get_language_index().get(name)
+    if lang is not None:
+        return EnvironmentLanguage.model_validate(lang)
     console.console.print(f'Language [item]{name}[/item] not found.', style='error')
     raise typer.Exit()
 
 
+def _get_set_fields(model: BaseModel) -> Dict[str, Any]:
+    # Cheaper than `model_dump(exclude_unset=True)`, as it does not serialize.
+    return {field: getattr(model, field) for field in model.model_fields_set}
+
+
 def _merge_shallow_models(model: Type[T], base: T, override: T) -> T:
     return model(
         **{
-            **base.model_dump(exclude_unset=True),
-            **override.model_dump(exclude_unset=True),
+            **_get_set_fields(base),
+            **_get_set_fields(override),
         }
     )
 
 
+_DEFAULT_COMPILATION_SANDBOX = EnvironmentSandbox(
+    maxProcesses=None,
+    timeLimit=10000,
+    wallTimeLimit=10000,
+    memoryLimit=512,
+    preserveEnv=True,
+    mirrorDirs=['/etc', '/usr'],
+)
+
+
 def merge_compilation_configs(
     compilation_configs: List[Optional[CompilationConfig]],
 ) -> CompilationConfig:
     merged_cfg = CompilationConfig()
-    merged_cfg.sandbox = EnvironmentSandbox(
-        maxProcesses=None,
-        timeLimit=10000,
-        wallTimeLimit=10000,
-        memoryLimit=512,
-        preserveEnv=True,
-        mirrorDirs=['/etc', '/usr'],
-    )
+    merged_cfg.sandbox = _DEFAULT_COMPILATION_SANDBOX.model_copy(deep=True)
     for cfg in compilation_configs:
         if cfg is None:
             continue
@@ -211,14 +284,36 @@ def merge_compilation_configs(
     return merged_cfg
 
 
-@functools.cache
-def get_compilation_config(language: str) -> CompilationConfig:
+@dataclasses.dataclass(frozen=True)
+class LanguageConfig:
+    compilation: CompilationConfig
+    execution: ExecutionConfig
+    file_mapping: FileMapping
+
+
+@cache_utils.memoize(_CACHE)
+def get_language_config(language: str) -> LanguageConfig:
     environment = get_environment()
-    return merge_compilation_configs(
-        [environment.defaultCompilation, get_language(language).compilation]
+    lang = get_language(language)
+    return LanguageConfig(
+        compilation=merge_compilation_configs(
+            [environment.defaultCompilation, lang.compilation]
+        ),
+        execution=merge_execution_configs(
+            [environment.defaultExecution, lang.execution]
+        ),
+        file_mapping=_merge_shallow_models(
+            FileMapping,
+            environment.defaultFileMapping or FileMapping(),
+            lang.fileMapping or FileMapping(),
+        ),
     )
 
 
+def get_compilation_config(language: str) -> CompilationConfig:
+    return get_language_config(language).compilation
+
+
 def merge_execution_configs(
     execution_configs: List[Optional[ExecutionConfig]],
 ) -> ExecutionConfig:
@@ -235,25 +330,15 @@ def merge_execution_configs(
     return merged_cfg
 
 
-@functools.cache
 def get_execution_config(language: str) -> ExecutionConfig:
-    environment = get_environment()
-    return merge_execution_configs(
-        [environment.defaultExecution, get_language(language).execution]
-    )
+    return get_language_config(language).execution
 
 
-@functools.cache
 def get_file_mapping(language: str) -> FileMapping:
-    environment = get_environment()
-    return _merge_shallow_models(
-        FileMapping,
-        environment.defaultFileMapping or FileMapping(),
-        get_language(language).fileMapping or FileMapping(),
-    )
+    return get_language_config(language).file_mapping
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_sandbox_type() -> Type[SandboxBase]:
     used_sandbox = get_environment().sandbox
     if used_sandbox == 'stupid':
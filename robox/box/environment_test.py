@@ -0,0 +1,84 @@
+import os
+import pathlib
+
+import pytest
+import typer
+
+from robox.box.environment import (
+    Environment,
+    _get_environment_cache_path,
+    _load_environment,
+)
+
+_ENVIRONMENT_YAML = """
+sandbox: isolate
+defaultExecution:
+  sandbox:
+    timeLimit: 1000
+"""
+
+
+def _write_environment(tmp_path: pathlib.Path) -> pathlib.Path:
+    env_path = tmp_path / 'env.rbx.yml'
+    env_path.write_text(_ENVIRONMENT_YAML)
+    return env_path
+
+
+def test_load_environment_round_trips_set_fields(tmp_path: pathlib.Path):
+    env_path = _write_environment(tmp_path)
+    environment = _load_environment(env_path)
+    assert _get_environment_cache_path(env_path).is_file()
+
+    cached_environment = _load_environment(env_path)
+    assert cached_environment == environment
+    assert cached_environment.model_fields_set == {'sandbox', 'defaultExecution'}
+    assert cached_environment.defaultExecution is not None
+    assert cached_environment.defaultExecution.model_fields_set == {'sandbox'}
+    assert cached_environment.defaultExecution.sandbox is not None
+    assert cached_environment.defaultExecution.sandbox.model_fields_set == {'timeLimit'}
+
+
+def test_load_environment_uses_fresh_cache(tmp_path: pathlib.Path):
+    env_path = _write_environment(tmp_path)
+    _load_environment(env_path)
+    cache_path = _get_environment_cache_path(env_path)
+    cache_path.write_text('{"preset": "cached"}')
+
+    assert _load_environment(env_path).preset == 'cached'
+
+
+def test_load_environment_ignores_stale_cache(tmp_path: pathlib.Path):
+    env_path = _write_environment(tmp_path)
+    _load_environment(env_path)
+    cache_path = _get_environment_cache_path(env_path)
+    cache_path.write_text('{"preset": "cached"}')
+    mtime_ns = cache_path.stat().st_mtime_ns
+    os.utime(env_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+    environment = _load_environment(env_path)
+    assert environment.preset == 'default'
+    assert environment.sandbox == 'isolate'
+
+
+def test_load_environment_ignores_invalid_cache(tmp_path: pathlib.Path):
+    env_path = _write_environment(tmp_path)
+    _load_environment(env_path)
+    _get_environment_cache_path(env_path).write_text('{"unknown": 1}')
+
+    assert _load_environment(env_path).sandbox == 'isolate'
+
+
+def test_load_environment_requires_language_names(tmp_path: pathlib.Path):
+    env_path = tmp_path / 'env.rbx.yml'
+    env_path.write_text('languages:\n  - extension: cpp\n')
+
+    with pytest.raises(typer.Exit):
+        _load_environment(env_path)
+
+
+def test_environment_schema_describes_languages():
+    schema = Environment.model_json_schema()
+    assert schema['properties']['languages']['items'] == {
+        '$ref': '#/$defs/EnvironmentLanguage'
+    }
+    assert 'name' in schema['$defs']['EnvironmentLanguage']['required']
@@ -8,16 +8,13 @@ import typer
 
 from robox import annotations, config, console, utils
 from robox.box import (
-    builder,
     download,
     environment,
     package,
     packaging,
     presets,
-    stresses,
 )
 from robox.box.environment import VerificationLevel, get_environment_path
-from robox.box.solutions import print_run_report, run_solutions
 from robox.box.statements import build_statements
 
 app = typer.Typer(no_args_is_help=True, cls=annotations.AliasGroup)
@@ -38,11 +35,15 @@ def edit():
 
 @app.command('build, b')
 def build(verification: environment.VerificationParam):
+    from robox.box import builder
+
     builder.build(verification=verification)
 
 
 @app.command('verify')
 def verify(verification: environment.VerificationParam):
+    from robox.box import builder
+
     if not builder.verify(verification=verification):
         console.console.print('[error]Verification failed, check the report.[/error]')
 
@@ -53,6 +54,9 @@ def run(
     solution: Annotated[Optional[str], typer.Argument()] = None,
     detailed: bool = typer.Option(False, '--detailed', '-d'),
 ):
+    from robox.box import builder
+    from robox.box.solutions import print_run_report, run_solutions
+
     builder.build(verification=verification)
 
     with utils.StatusProgress('Running solutions...') as s:
@@ -109,6 +113,8 @@ def stress(
     timeout: Annotated[int, typer.Option()] = 10,
     findings: Annotated[int, typer.Option()] = 1,
 ):
+    from robox.box import builder, stresses
+
     # Do not verify built package.
     builder.build(verification=VerificationLevel.NONE.value)
 
@@ -180,8 +186,8 @@ def environment_command(env: Annotated[Optional[str], typer.Argument()] = None):
 @app.command('clear, clean')
 def clear():
     console.console.print('Cleaning cache and build directories...')
-    shutil.rmtree('.box', ignore_errors=True)
-    shutil.rmtree('build', ignore_errors=True)
+    utils.rmtree_in_background('.box')
+    utils.rmtree_in_background('build')
 
 
 @app.callback()
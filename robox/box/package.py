@@ -1,10 +1,9 @@
-import functools
 import pathlib
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 
-from robox import console, utils
+from robox import cache_utils, console, utils
 from robox.box.environment import get_sandbox_type
 from robox.box.schema import (
     CodeItem,
@@ -25,8 +24,10 @@ YAML_NAME = 'problem.rbx.yml'
 _DEFAULT_CHECKER = 'wcmp.cpp'
 TEMP_DIR = None
 
+_CACHE: Dict[Any, Any] = {}
 
-@functools.cache
+
+@cache_utils.memoize(_CACHE)
 def find_problem_yaml(root: pathlib.Path = pathlib.Path()) -> Optional[pathlib.Path]:
     problem_yaml_path = root / YAML_NAME
     while root != pathlib.PosixPath('.') and not problem_yaml_path.is_file():
@@ -37,7 +38,7 @@ def find_problem_yaml(root: pathlib.Path = pathlib.Path()) -> Optional[pathlib.P
     return problem_yaml_path
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def find_problem_package(root: pathlib.Path = pathlib.Path()) -> Optional[Package]:
     problem_yaml_path = find_problem_yaml(root)
     if not problem_yaml_path:
@@ -72,14 +73,14 @@ def save_package(
     problem_yaml_path.write_text(utils.model_to_yaml(package))
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_problem_cache_dir(root: pathlib.Path = pathlib.Path()) -> pathlib.Path:
     cache_dir = find_problem(root) / '.box'
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_problem_storage_dir(root: pathlib.Path = pathlib.Path()) -> pathlib.Path:
     storage_dir = get_problem_cache_dir(root) / '.storage'
     storage_dir.mkdir(parents=True, exist_ok=True)
@@ -92,22 +93,22 @@ def get_problem_runs_dir(root: pathlib.Path = pathlib.Path()) -> pathlib.Path:
     return runs_dir
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_cache_storage(root: pathlib.Path = pathlib.Path()) -> Storage:
     return FilesystemStorage(get_problem_storage_dir(root))
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_dependency_cache(root: pathlib.Path = pathlib.Path()) -> DependencyCache:
     return DependencyCache(get_problem_cache_dir(root), get_cache_storage(root))
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_file_cacher(root: pathlib.Path = pathlib.Path()) -> FileCacher:
     return FileCacher(get_cache_storage(root))
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_digest_as_string(
     digest: str, root: pathlib.Path = pathlib.Path()
 ) -> Optional[str]:
@@ -123,22 +124,22 @@ def get_new_sandbox(root: pathlib.Path = pathlib.Path()) -> SandboxBase:
     return get_sandbox_type()(file_cacher=get_file_cacher(root), temp_dir=TEMP_DIR)
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_singleton_sandbox(root: pathlib.Path = pathlib.Path()) -> SandboxBase:
     return get_new_sandbox(root)
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_build_path(root: pathlib.Path = pathlib.Path()) -> pathlib.Path:
     return find_problem(root) / 'build'
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_build_tests_path(root: pathlib.Path = pathlib.Path()) -> pathlib.Path:
     return get_build_path(root) / 'tests'
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_build_testgroup_path(
     group: str, root: pathlib.Path = pathlib.Path()
 ) -> pathlib.Path:
@@ -147,7 +148,7 @@ def get_build_testgroup_path(
     return res
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_generator(name: str, root: pathlib.Path = pathlib.Path()) -> Generator:
     package = find_problem_package_or_die(root)
     for generator in package.generators:
@@ -157,7 +158,7 @@ def get_generator(name: str, root: pathlib.Path = pathlib.Path()) -> Generator:
     raise typer.Exit(1)
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_checker(root: pathlib.Path = pathlib.Path()) -> CodeItem:
     package = find_problem_package_or_die(root)
 
@@ -166,13 +167,13 @@ def get_checker(root: pathlib.Path = pathlib.Path()) -> CodeItem:
     )
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_solutions(root: pathlib.Path = pathlib.Path()) -> List[Solution]:
     package = find_problem_package_or_die(root)
     return package.solutions
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_main_solution(root: pathlib.Path = pathlib.Path()) -> Optional[Solution]:
     for solution in get_solutions(root):
         if solution.outcome == ExpectedOutcome.ACCEPTED:
@@ -180,7 +181,7 @@ def get_main_solution(root: pathlib.Path = pathlib.Path()) -> Optional[Solution]
     return None
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_solution(name: str, root: pathlib.Path = pathlib.Path()) -> Solution:
     for solution in get_solutions(root):
         if str(solution.path) == name:
@@ -189,7 +190,7 @@ def get_solution(name: str, root: pathlib.Path = pathlib.Path()) -> Solution:
     raise typer.Exit(1)
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_stress(name: str, root: pathlib.Path = pathlib.Path()) -> Stress:
     pkg = find_problem_package_or_die(root)
     for stress in pkg.stresses:
@@ -199,7 +200,7 @@ def get_stress(name: str, root: pathlib.Path = pathlib.Path()) -> Stress:
     raise typer.Exit(1)
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_testgroup(name: str, root: pathlib.Path = pathlib.Path()) -> TestcaseGroup:
     pkg = find_problem_package_or_die(root)
     for testgroup in pkg.testcases:
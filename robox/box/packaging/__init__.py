@@ -5,12 +5,11 @@ from typing import Type
 import typer
 
 from robox import annotations, console
-from robox.box import builder, environment, package
+from robox.box import environment, package
 from robox.box.package import get_build_path
-from robox.box.packaging.boca.packager import BocaPackager
 from robox.box.packaging.packager import BasePackager, BuiltStatement
-from robox.box.packaging.polygon.packager import PolygonPackager
 from robox.box.statements.build_statements import build_statement
+from robox.box.testcases import get_samples
 
 app = typer.Typer(no_args_is_help=True, cls=annotations.AliasGroup)
 
@@ -19,6 +18,8 @@ def run_packager(
     packager_cls: Type[BasePackager],
     verification: environment.VerificationParam,
 ):
+    from robox.box import builder
+
     if not builder.verify(verification=verification):
         console.console.print(
             '[error]Build or verification failed, check the report.[/error]'
@@ -30,12 +31,16 @@ def run_packager(
 
     statement_types = packager.statement_types()
     built_statements = []
+    # Samples are the same for every statement, so scan them only once.
+    samples = get_samples()
 
     for statement_type in statement_types:
         languages = packager.languages()
         for language in languages:
             statement = packager.get_statement_for_language(language)
-            statement_path = build_statement(statement, pkg, statement_type)
+            statement_path = build_statement(
+                statement, pkg, statement_type, samples=samples
+            )
             built_statements.append(
                 BuiltStatement(statement, statement_path, statement_type)
             )
@@ -55,6 +60,8 @@ def run_packager(
 def polygon(
     verification: environment.VerificationParam,
 ):
+    from robox.box.packaging.polygon.packager import PolygonPackager
+
     run_packager(PolygonPackager, verification=verification)
 
 
@@ -62,4 +69,6 @@ def polygon(
 def boca(
     verification: environment.VerificationParam,
 ):
+    from robox.box.packaging.boca.packager import BocaPackager
+
     run_packager(BocaPackager, verification=verification)
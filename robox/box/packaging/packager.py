@@ -1,7 +1,7 @@
 import dataclasses
 import pathlib
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from robox.box import package
 from robox.box.generators import get_all_built_testcases
@@ -18,18 +18,24 @@ class BuiltStatement:
 
 class BasePackager(ABC):
     built_statements: List[BuiltStatement]
+    _built_testcases_per_group: Optional[Dict[str, List[Testcase]]] = None
+    _statements_per_language: Optional[Dict[str, Statement]] = None
 
     @abstractmethod
     def name(self) -> str:
         pass
 
-    def languages(self):
-        pkg = package.find_problem_package_or_die()
+    def _get_statements_per_language(self) -> Dict[str, Statement]:
+        if self._statements_per_language is None:
+            pkg = package.find_problem_package_or_die()
+            # Reversed, so the first statement of each language wins.
+            self._statements_per_language = {
+                statement.language: statement for statement in reversed(pkg.statements)
+            }
+        return self._statements_per_language
 
-        res = set()
-        for statement in pkg.statements:
-            res.add(statement.language)
-        return sorted(res)
+    def languages(self):
+        return sorted(self._get_statements_per_language())
 
     def statement_types(self) -> List[StatementType]:
         return [StatementType.PDF]
@@ -39,8 +45,11 @@ class BasePackager(ABC):
         pass
 
     # Helper methods.
-    def get_built_testcases_per_group(self):
-        return get_all_built_testcases()
+    def get_built_testcases_per_group(self) -> Dict[str, List[Testcase]]:
+        # Packaging happens after the build, so testcases do not change anymore.
+        if self._built_testcases_per_group is None:
+            self._built_testcases_per_group = get_all_built_testcases()
+        return self._built_testcases_per_group
 
     def get_built_testcases(self) -> List[Tuple[TestcaseGroup, List[Testcase]]]:
         pkg = package.find_problem_package_or_die()
@@ -57,8 +66,7 @@ class BasePackager(ABC):
         return res
 
     def get_statement_for_language(self, lang: str) -> Statement:
-        pkg = package.find_problem_package_or_die()
-        for statement in pkg.statements:
-            if statement.language == lang:
-                return statement
+        statements_per_language = self._get_statements_per_language()
+        if lang in statements_per_language:
+            return statements_per_language[lang]
         raise
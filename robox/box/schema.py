@@ -1,5 +1,5 @@
 import pathlib
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pydantic_core import PydanticCustomError
@@ -25,28 +25,28 @@ class ExpectedOutcome(AutoEnum):
     TLE_OR_RTE = alias('tle or rte', 'tle/rte', 'tle+rte')  # type: ignore
 
     def match(self, outcome: Outcome) -> bool:
-        match self:
-            case ExpectedOutcome.ACCEPTED:
-                return outcome == Outcome.ACCEPTED
-            case ExpectedOutcome.WRONG_ANSWER:
-                return outcome == Outcome.WRONG_ANSWER
-            case ExpectedOutcome.INCORRECT:
-                return outcome in {
-                    Outcome.WRONG_ANSWER,
-                    Outcome.RUNTIME_ERROR,
-                    Outcome.MEMORY_LIMIT_EXCEEDED,
-                    Outcome.TIME_LIMIT_EXCEEDED,
-                }
-            case ExpectedOutcome.RUNTIME_ERROR:
-                return outcome == Outcome.RUNTIME_ERROR
-            case ExpectedOutcome.TIME_LIMIT_EXCEEDED:
-                return outcome == Outcome.TIME_LIMIT_EXCEEDED
-            case ExpectedOutcome.MEMORY_LIMIT_EXCEEDED:
-                return outcome == Outcome.MEMORY_LIMIT_EXCEEDED
-            case ExpectedOutcome.TLE_OR_RTE:
-                return outcome in {Outcome.TIME_LIMIT_EXCEEDED, Outcome.RUNTIME_ERROR}
-            case _:
-                return False
+        return outcome in _MATCHED_OUTCOMES.get(self, frozenset())
+
+
+# Outcomes accepted by each expected outcome.
+_MATCHED_OUTCOMES: Dict[ExpectedOutcome, FrozenSet[Outcome]] = {
+    ExpectedOutcome.ACCEPTED: frozenset({Outcome.ACCEPTED}),
+    ExpectedOutcome.WRONG_ANSWER: frozenset({Outcome.WRONG_ANSWER}),
+    ExpectedOutcome.INCORRECT: frozenset(
+        {
+            Outcome.WRONG_ANSWER,
+            Outcome.RUNTIME_ERROR,
+            Outcome.MEMORY_LIMIT_EXCEEDED,
+            Outcome.TIME_LIMIT_EXCEEDED,
+        }
+    ),
+    ExpectedOutcome.RUNTIME_ERROR: frozenset({Outcome.RUNTIME_ERROR}),
+    ExpectedOutcome.TIME_LIMIT_EXCEEDED: frozenset({Outcome.TIME_LIMIT_EXCEEDED}),
+    ExpectedOutcome.MEMORY_LIMIT_EXCEEDED: frozenset({Outcome.MEMORY_LIMIT_EXCEEDED}),
+    ExpectedOutcome.TLE_OR_RTE: frozenset(
+        {Outcome.TIME_LIMIT_EXCEEDED, Outcome.RUNTIME_ERROR}
+    ),
+}
 
 
 class CodeItem(BaseModel):
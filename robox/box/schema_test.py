@@ -0,0 +1,11 @@
+from robox.box.schema import ExpectedOutcome
+from robox.grading.steps import Outcome
+
+
+def test_expected_outcome_match():
+    assert ExpectedOutcome.ACCEPTED.match(Outcome.ACCEPTED)
+    assert not ExpectedOutcome.ACCEPTED.match(Outcome.WRONG_ANSWER)
+    assert ExpectedOutcome.INCORRECT.match(Outcome.TIME_LIMIT_EXCEEDED)
+    assert not ExpectedOutcome.INCORRECT.match(Outcome.ACCEPTED)
+    assert ExpectedOutcome.TLE_OR_RTE.match(Outcome.RUNTIME_ERROR)
+    assert not ExpectedOutcome.TLE_OR_RTE.match(Outcome.WRONG_ANSWER)
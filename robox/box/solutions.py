@@ -9,8 +9,8 @@ from robox import console
 from robox.box import checkers, environment, package
 from robox.box.code import compile_item, run_item
 from robox.box.environment import EnvironmentSandbox, ExecutionConfig, VerificationLevel
-from robox.box.schema import Solution
-from robox.box.testcases import find_built_testcases
+from robox.box.generators import get_all_built_testcases
+from robox.box.schema import Solution, Testcase
 from robox.grading.steps import (
     DigestOrDest,
     DigestOrSource,
@@ -61,8 +61,11 @@ def run_solution(
     index: int,
     progress: Optional[StatusProgress] = None,
     verification: VerificationLevel = VerificationLevel.NONE,
+    testcases_per_group: Optional[Dict[str, List[Testcase]]] = None,
 ) -> Dict[str, List[Evaluation]]:
     pkg = package.find_problem_package_or_die()
+    if testcases_per_group is None:
+        testcases_per_group = get_all_built_testcases()
 
     sandbox = EnvironmentSandbox()
     sandbox.timeLimit = pkg.timeLimit
@@ -75,15 +78,16 @@ def run_solution(
 
     res = collections.defaultdict(list)
 
+    runs_dir = package.get_problem_runs_dir() / f'{index}'
     for group in pkg.testcases:
-        testcases = find_built_testcases(group)
+        group_runs_dir = runs_dir / group.name
+        group_runs_dir.mkdir(parents=True, exist_ok=True)
+        testcases = testcases_per_group[group.name]
         for i, testcase in enumerate(testcases):
-            runs_dir = package.get_problem_runs_dir()
             assert testcase.outputPath is not None
-            output_path = runs_dir / f'{index}' / group.name / testcase.outputPath.name
+            output_path = group_runs_dir / testcase.outputPath.name
             error_path = output_path.with_suffix('.err')
             log_path = output_path.with_suffix('.log')
-            output_path.parent.mkdir(parents=True, exist_ok=True)
 
             if progress:
                 progress.update(
@@ -110,8 +114,10 @@ def run_solution(
                 testcase=TestcaseIO(
                     index=i, input=testcase.inputPath, output=testcase.outputPath
                 ),
-                log=TestcaseLog(
-                    **(run_log.model_dump() if run_log is not None else {}),
+                # Fields of the run log are already validated, so skip
+                # dumping and validating them again.
+                log=TestcaseLog.model_construct(
+                    **(dict(run_log) if run_log is not None else {}),
                     stdout_absolute_path=output_path.absolute(),
                     stderr_absolute_path=error_path.absolute(),
                     log_absolute_path=log_path.absolute(),
@@ -136,55 +142,65 @@ def run_solutions(
     compiled_solutions = compile_solutions(
         progress=progress, tracked_solutions=tracked_solutions
     )
+    # Scanned once here, instead of once per solution.
+    testcases_per_group = get_all_built_testcases()
     res = []
 
     for i, solution in enumerate(pkg.solutions):
-        if (
-            tracked_solutions is not None
-            and str(solution.path) not in tracked_solutions
-        ):
+        # Only tracked solutions were compiled.
+        compiled_digest = compiled_solutions.get(solution.path)
+        if compiled_digest is None:
             res.append({})
             continue
         results_per_group = run_solution(
             solution,
-            compiled_solutions[solution.path],
+            compiled_digest,
             checker_digest,
             i,
             progress=progress,
             verification=verification,
+            testcases_per_group=testcases_per_group,
         )
         res.append(results_per_group)
 
     return res
 
 
+_OUTCOME_STYLES = {
+    Outcome.ACCEPTED: 'green',
+    Outcome.WRONG_ANSWER: 'red',
+    Outcome.TIME_LIMIT_EXCEEDED: 'yellow',
+    Outcome.RUNTIME_ERROR: 'lnumber',
+    Outcome.MEMORY_LIMIT_EXCEEDED: 'cyan',
+}
+
+
 def get_outcome_style_verdict(outcome: Outcome) -> str:
+    return _OUTCOME_STYLES.get(outcome, 'magenta')
+
+
+def _get_outcome_marker(outcome: Outcome) -> str:
     if outcome == Outcome.ACCEPTED:
-        return 'green'
-    if outcome == Outcome.WRONG_ANSWER:
-        return 'red'
+        return '✓'
     if outcome == Outcome.TIME_LIMIT_EXCEEDED:
-        return 'yellow'
-    if outcome == Outcome.RUNTIME_ERROR:
-        return 'lnumber'
-    if outcome == Outcome.MEMORY_LIMIT_EXCEEDED:
-        return 'cyan'
-    return 'magenta'
+        return '⧖'
+    return '✗'
+
+
+def _get_outcome_markup(outcome: Outcome) -> str:
+    style = get_outcome_style_verdict(outcome)
+    return f'[{style}]{_get_outcome_marker(outcome)}[/{style}]'
+
+
+# Verdict markup is the same for every testcase with a given outcome.
+_OUTCOME_MARKUPS = {outcome: _get_outcome_markup(outcome) for outcome in Outcome}
 
 
 def _get_testcase_markup_verdict(eval: Evaluation) -> str:
-    res = '✓'
-    if eval.result.outcome != Outcome.ACCEPTED:
-        res = '✗'
-    if eval.result.outcome == Outcome.TIME_LIMIT_EXCEEDED:
-        res = '⧖'
-    if eval.result.outcome == Outcome.RUNTIME_ERROR:
-        res = '✗'
-    style = get_outcome_style_verdict(eval.result.outcome)
-    res = f'[{style}]{res}[/{style}]'
+    res = _OUTCOME_MARKUPS[eval.result.outcome]
     if eval.log.stdout_absolute_path:
-        output_path = eval.log.stdout_absolute_path.resolve()
-        output_link = f'file://{output_path}'
+        # Already absolute, as built in `run_solution`.
+        output_link = f'file://{eval.log.stdout_absolute_path}'
         res = f'[link={output_link}]{res}[/link]'
     return res
 
@@ -193,9 +209,12 @@ def _get_evals_time_in_ms(evals: List[Evaluation]) -> int:
     return max(int((eval.log.time or 0.0) * 1000) for eval in evals)
 
 
+def _format_time_in_ms(time_in_ms: int) -> str:
+    return f'{time_in_ms} ms'
+
+
 def _get_evals_formatted_time(evals: List[Evaluation]) -> str:
-    max_time = _get_evals_time_in_ms(evals)
-    return f'{max_time} ms'
+    return _format_time_in_ms(_get_evals_time_in_ms(evals))
 
 
 def _print_solution_outcome(
@@ -204,6 +223,7 @@ def _print_solution_outcome(
     timeLimit: int,
     console: rich.console.Console,
     verification: VerificationLevel = VerificationLevel.NONE,
+    evals_time: Optional[int] = None,
 ) -> bool:
     bad_verdicts = set()
     for eval in evals:
@@ -220,14 +240,19 @@ def _print_solution_outcome(
     else:
         console.print('[success]OK[/success]', end=' ')
 
-    console.print(f'Expected: {solution.outcome}', end='')
+    console.print(f'Expected: {solution.outcome}', end='', markup=False)
 
     if unmatched_bad_verdicts:
         unmatched_bad_verdicts_names = set(v.name for v in unmatched_bad_verdicts)
-        console.print(f', got: {" ".join(unmatched_bad_verdicts_names)}', end='')
+        console.print(
+            f', got: {" ".join(unmatched_bad_verdicts_names)}',
+            end='',
+            markup=False,
+        )
 
     console.print()
-    evals_time = _get_evals_time_in_ms(evals)
+    if evals_time is None:
+        evals_time = _get_evals_time_in_ms(evals)
     if (
         not (matched_bad_verdicts - {Outcome.TIME_LIMIT_EXCEEDED})
         and verification.value >= VerificationLevel.FULL.value
@@ -237,7 +262,7 @@ def _print_solution_outcome(
         console.print(
             '[yellow]WARNING[/yellow] The solution still passed in double TL.'
         )
-    console.print(f'Time: {_get_evals_formatted_time(evals)}')
+    console.print(f'Time: {_format_time_in_ms(evals_time)}')
     return len(unmatched_bad_verdicts) == 0
 
 
@@ -299,20 +324,38 @@ def print_run_report(
         if not evals_per_group:
             continue
         solution_testdir = package.get_problem_runs_dir() / f'{s}'
-        console.print(f'[item]{solution.path}[/item]', end=' ')
-        console.print(f'({solution_testdir})')
+        console.print(f'[item]{solution.path}[/item] ({solution_testdir})')
 
         all_evals = []
+        # Max. time of each group, reused for the time of the whole solution.
+        group_times: List[int] = []
         for group, evals in evals_per_group.items():
             all_evals.extend(evals)
+            group_time = _get_evals_time_in_ms(evals) if evals else 0
+            group_times.append(group_time)
             if detailed:
                 continue
-            console.print(f'[bold][status]{group}[/status][/bold]', end=' ')
-            console.print(f'({_get_evals_formatted_time(evals)})', end=' ')
-            for i, eval in enumerate(evals):
-                console.print(f'{i}/', end='')
-                console.print(_get_testcase_markup_verdict(eval), end=' ')
-            console.print()
+            formatted_time = _format_time_in_ms(group_time)
+            if not console.is_terminal:
+                # Styles and links are dropped when not writing to a terminal
+                # anyway, so skip building and parsing markup altogether.
+                verdicts = ' '.join(
+                    f'{i}/{_get_outcome_marker(eval.result.outcome)}'
+                    for i, eval in enumerate(evals)
+                )
+                console.print(
+                    f'{group} ({formatted_time}) {verdicts}',
+                    markup=False,
+                )
+                continue
+            # Build the whole line first, as each print re-parses markup.
+            verdicts = ' '.join(
+                f'{i}/{_get_testcase_markup_verdict(eval)}'
+                for i, eval in enumerate(evals)
+            )
+            console.print(
+                f'[bold][status]{group}[/status][/bold] ({formatted_time}) {verdicts}'
+            )
 
         cur_ok = _print_solution_outcome(
             solution,
@@ -320,6 +363,7 @@ def print_run_report(
             pkg.timeLimit,
             console,
             verification=VerificationLevel(verification),
+            evals_time=max(group_times),
         )
         ok = ok and cur_ok
         console.print()
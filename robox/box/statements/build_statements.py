@@ -1,12 +1,16 @@
+import collections
+import concurrent.futures
+import os
 import pathlib
 import typing
-from typing import Annotated, Dict, List, Optional, Tuple
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
 import typer
 
-from robox import annotations, console
-from robox.box import builder, environment, package
-from robox.box.schema import Package
+import robox
+from robox import annotations, cache_utils, console, utils
+from robox.box import environment, package
+from robox.box.schema import Package, Testcase
 from robox.box.statements.builders import (
     BUILDER_LIST,
     StatementBuilder,
@@ -16,15 +20,37 @@ from robox.box.statements.builders import (
 )
 from robox.box.statements.schema import PipelineStep, Statement, StatementType
 from robox.box.testcases import get_samples
+from robox.grading.judge.digester import Digester, digest_cooperatively
 
 app = typer.Typer(no_args_is_help=True, cls=annotations.AliasGroup)
 
+_CACHE: Dict[Any, Any] = {}
 
+# Statement contents and file digests, keyed by path and the stat fields that
+# change on writes.
+_STATEMENT_CONTENTS: Dict[Tuple[str, int, int], bytes] = {}
+_FILE_DIGESTS: Dict[Tuple[str, int, int], str] = {}
+
+_BUILDERS_BY_NAME = {builder.name(): builder for builder in BUILDER_LIST}
+
+
+def _index_builders_by_input_type() -> Dict[StatementType, List[StatementBuilder]]:
+    res: Dict[StatementType, List[StatementBuilder]] = collections.defaultdict(list)
+    for builder in BUILDER_LIST:
+        res[builder.input_type()].append(builder)
+    return dict(res)
+
+
+_BUILDERS_BY_INPUT_TYPE = _index_builders_by_input_type()
+
+
+@cache_utils.memoize(_CACHE)
 def _get_environment_languages_for_statement() -> List[StatementCodeLanguage]:
     env = environment.get_environment()
 
     res = []
-    for language in env.languages:
+    for raw_language in env.languages:
+        language = environment.get_language(raw_language['name'])
         cmd = ''
         compilation_cfg = environment.get_compilation_config(language.name)
         cmd = ' & '.join(compilation_cfg.commands or [])
@@ -42,35 +68,30 @@ def _get_environment_languages_for_statement() -> List[StatementCodeLanguage]:
 
 
 def get_builder(name: str) -> StatementBuilder:
-    candidates = [builder for builder in BUILDER_LIST if builder.name() == name]
-    if not candidates:
+    builder = _BUILDERS_BY_NAME.get(name)
+    if builder is None:
         console.console.print(
             f'[error]No statement builder found with name [name]{name}[/name][/error]'
         )
         raise typer.Exit(1)
-    return candidates[0]
+    return builder
 
 
+@cache_utils.memoize(_CACHE)
 def get_implicit_builders(
     input_type: StatementType, output_type: StatementType
 ) -> Optional[List[StatementBuilder]]:
     par: Dict[StatementType, Optional[StatementBuilder]] = {input_type: None}
 
-    def _iterate() -> bool:
-        nonlocal par
-        for bdr in BUILDER_LIST:
-            u = bdr.input_type()
-            if u not in par:
-                continue
+    queue = collections.deque([input_type])
+    while queue and output_type not in par:
+        u = queue.popleft()
+        for bdr in _BUILDERS_BY_INPUT_TYPE.get(u, []):
             v = bdr.output_type()
             if v in par:
                 continue
             par[v] = bdr
-            return True
-        return False
-
-    while _iterate() and output_type not in par:
-        pass
+            queue.append(v)
 
     if output_type not in par:
         return None
@@ -131,61 +152,220 @@ def _get_relative_assets(
     statement_path: pathlib.Path,
     assets: List[pathlib.Path],
 ) -> List[Tuple[pathlib.Path, pathlib.Path]]:
+    # Compared as plain strings, with a trailing separator so that sibling
+    # directories sharing a prefix are not mistaken for the statement one.
+    statement_dir = os.path.join(os.path.dirname(os.path.realpath(statement_path)), '')
     res = []
     for asset in assets:
-        if not asset.is_file() or not asset.resolve().is_relative_to(
-            statement_path.resolve().parent
-        ):
+        real_asset = os.path.realpath(asset)
+        if not real_asset.startswith(statement_dir) or not os.path.isfile(real_asset):
             console.console.print(
                 f'[error]Asset [item]{asset}[/item] is not relative to your statement.[/error]'
             )
             raise typer.Exit(1)
 
-        res.append(
-            (asset, asset.resolve().relative_to(statement_path.resolve().parent))
-        )
+        res.append((asset, pathlib.Path(real_asset[len(statement_dir) :])))
 
     return res
 
 
-def build_statement(
-    statement: Statement, pkg: Package, output_type: Optional[StatementType] = None
-) -> pathlib.Path:
-    if not statement.path.is_file():
+def _update_digester(digester: Digester, data: bytes):
+    # Length-prefixed, so that consecutive fields cannot be mistaken
+    # for one another.
+    digester.update(len(data).to_bytes(8, 'little'))
+    digester.update(data)
+
+
+def _get_file_digest(path: pathlib.Path) -> str:
+    # Files are only hashed again after they change.
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return ''
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    digest = _FILE_DIGESTS.get(key)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = digest_cooperatively(f)
+        _FILE_DIGESTS[key] = digest
+    return digest
+
+
+@cache_utils.memoize(_CACHE)
+def _get_code_fingerprint() -> str:
+    # The version alone is not enough, as it does not change in source
+    # checkouts, so the code of the statement builders is hashed as well.
+    digester = Digester()
+    _update_digester(digester, robox.__version__.encode())
+    for path in sorted(pathlib.Path(__file__).parent.glob('*.py')):
+        _update_digester(digester, path.name.encode())
+        _update_digester(digester, path.read_bytes())
+    return digester.digest()
+
+
+def _update_digester_with_assets(
+    digester: Digester, assets: List[Tuple[pathlib.Path, pathlib.Path]]
+):
+    for asset_in, asset_out in assets:
+        _update_digester(digester, str(asset_out).encode())
+        _update_digester(digester, _get_file_digest(asset_in).encode())
+
+
+def _get_statement_digest(
+    assets: List[Tuple[pathlib.Path, pathlib.Path]],
+    languages: List[StatementCodeLanguage],
+    problem: StatementBuilderProblem,
+) -> str:
+    # Everything every step of a statement can see, including the contents
+    # of assets and samples, which pdflatex reads from disk. Computed once
+    # per statement, and then combined with what is specific to each step.
+    digester = Digester()
+    _update_digester(digester, _get_code_fingerprint().encode())
+    _update_digester_with_assets(digester, assets)
+    for language in languages:
+        _update_digester(digester, language.name.encode())
+        _update_digester(digester, language.command.encode())
+    _update_digester(digester, problem.package.model_dump_json().encode())
+    _update_digester(digester, problem.statement.model_dump_json().encode())
+    for sample in problem.samples:
+        for path in (sample.inputPath, sample.outputPath):
+            _update_digester(digester, str(path).encode())
+            if path is not None:
+                _update_digester(digester, _get_file_digest(path).encode())
+    return digester.digest()
+
+
+def _get_step_digest(
+    bdr: StatementBuilder,
+    params: PipelineStep,
+    input: bytes,
+    injected_assets: List[Tuple[pathlib.Path, pathlib.Path]],
+    statement_digest: str,
+) -> str:
+    digester = Digester()
+    _update_digester(digester, statement_digest.encode())
+    bdr_cls = type(bdr)
+    _update_digester(digester, f'{bdr_cls.__module__}.{bdr_cls.__qualname__}'.encode())
+    _update_digester(digester, bdr.name().encode())
+    _update_digester(digester, params.model_dump_json().encode())
+    _update_digester(digester, input)
+    _update_digester_with_assets(digester, injected_assets)
+    return digester.digest()
+
+
+def _get_statement_cache_dir(statement: Statement) -> pathlib.Path:
+    digester = Digester()
+    _update_digester(digester, statement.language.encode())
+    _update_digester(digester, os.path.abspath(statement.path).encode())
+    return package.get_problem_cache_dir() / 'statements' / digester.digest()
+
+
+def _prune_step_cache(cache_dir: pathlib.Path, keep: str):
+    # Only the latest output of each step is kept, so the cache does not
+    # grow with every edit of the statement.
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            # Skip temporary files of writes in progress.
+            if entry.name != keep and not entry.name.startswith('.'):
+                pathlib.Path(entry.path).unlink(missing_ok=True)
+
+
+def _build_step(
+    bdr: StatementBuilder,
+    input: bytes,
+    context: StatementBuilderContext,
+    problem: StatementBuilderProblem,
+    injected_assets: List[Tuple[pathlib.Path, pathlib.Path]],
+    statement_digest: str,
+    cache_dir: pathlib.Path,
+) -> bytes:
+    digest = _get_step_digest(
+        bdr, context.params, input, injected_assets, statement_digest
+    )
+    cache_path = cache_dir / digest
+    try:
+        return cache_path.read_bytes()
+    except FileNotFoundError:
+        pass
+
+    output = bdr.build(input=input, context=context, problem=problem, verbose=False)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    utils.write_atomically(cache_path, output)
+    _prune_step_cache(cache_dir, keep=digest)
+    return output
+
+
+def _read_statement_content(path: pathlib.Path) -> bytes:
+    # A single stat is enough to reuse the contents when the same file is
+    # built for several output types or languages.
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    content = _STATEMENT_CONTENTS.get(key)
+    if content is None:
+        # Unbuffered, as the whole file is read at once.
+        with open(path, 'rb', buffering=0) as f:
+            content = f.read()
+        _STATEMENT_CONTENTS[key] = content
+    return content
+
+
+def _build_statement_content(
+    statement: Statement,
+    pkg: Package,
+    output_type: Optional[StatementType] = None,
+    samples: Optional[List[Testcase]] = None,
+) -> Tuple[bytes, StatementType]:
+    try:
+        last_content = _read_statement_content(statement.path)
+    except (FileNotFoundError, IsADirectoryError):
         console.console.print(
             f'[error]Statement file [item]{statement.path}[/item] does not exist.[/error]'
         )
-        raise typer.Exit(1)
+        raise typer.Exit(1) from None
     builders = get_builders(statement, output_type)
     last_output = statement.type
-    last_content = statement.path.read_bytes()
-    for bdr, params in builders:
-        assets = _get_relative_assets(
-            statement.path, statement.assets
-        ) + bdr.inject_assets(params)
-        output = bdr.build(
-            input=last_content,
+    languages = _get_environment_languages_for_statement()
+    # Assets of the statement are the same for every step of the pipeline.
+    statement_assets = _get_relative_assets(statement.path, statement.assets)
+    if samples is None:
+        samples = get_samples()
+    problem = StatementBuilderProblem(
+        package=pkg,
+        statement=statement,
+        samples=samples,
+    )
+    statement_digest = _get_statement_digest(statement_assets, languages, problem)
+    statement_cache_dir = _get_statement_cache_dir(statement)
+    for i, (bdr, params) in enumerate(builders):
+        injected_assets = bdr.inject_assets(params)
+        # Unchanged steps are reused from previous builds.
+        last_content = _build_step(
+            bdr,
+            last_content,
             context=StatementBuilderContext(
-                languages=_get_environment_languages_for_statement(),
+                languages=languages,
                 params=params,
-                assets=assets,
+                assets=statement_assets + injected_assets,
             ),
-            problem=StatementBuilderProblem(
-                package=pkg,
-                statement=statement,
-                samples=get_samples(),
-            ),
-            verbose=False,
+            problem=problem,
+            injected_assets=injected_assets,
+            statement_digest=statement_digest,
+            cache_dir=statement_cache_dir / f'{i}-{bdr.name()}',
         )
         last_output = bdr.output_type()
-        last_content = output
 
+    return last_content, last_output
+
+
+def _write_statement(
+    statement: Statement, content: bytes, output_type: StatementType
+) -> pathlib.Path:
     statement_path = (
         package.get_build_path()
-        / f'{statement.path.stem}{last_output.get_file_suffix()}'
+        / f'{statement.path.stem}{output_type.get_file_suffix()}'
     )
     statement_path.parent.mkdir(parents=True, exist_ok=True)
-    statement_path.write_bytes(last_content)
+    statement_path.write_bytes(content)
     console.console.print(
         f'Statement built successfully for language '
         f'[item]{statement.language}[/item] at '
@@ -194,6 +374,18 @@ def build_statement(
     return statement_path
 
 
+def build_statement(
+    statement: Statement,
+    pkg: Package,
+    output_type: Optional[StatementType] = None,
+    samples: Optional[List[Testcase]] = None,
+) -> pathlib.Path:
+    content, last_output = _build_statement_content(
+        statement, pkg, output_type=output_type, samples=samples
+    )
+    return _write_statement(statement, content, last_output)
+
+
 @app.command('build')
 def build(
     verification: environment.VerificationParam,
@@ -202,6 +394,8 @@ def build(
         Optional[StatementType], typer.Option(case_sensitive=False)
     ] = None,
 ):
+    from robox.box import builder
+
     # At most run the validators.
     builder.build(verification=verification)
 
@@ -210,6 +404,7 @@ def build(
     if not candidate_languages:
         candidate_languages = sorted(set([st.language for st in pkg.statements]))
 
+    statements: List[Statement] = []
     for language in candidate_languages:
         candidates_for_lang = [st for st in pkg.statements if st.language == language]
         if not candidates_for_lang:
@@ -217,8 +412,29 @@ def build(
                 f'[error]No statement found for language [item]{language}[/item].[/error]',
             )
             raise typer.Exit(1)
-
-        build_statement(candidates_for_lang[0], pkg, output_type=output)
+        statements.append(candidates_for_lang[0])
+
+    # Samples are the same for every language, so scan them only once.
+    samples = get_samples()
+
+    # Languages are built independently, and most of the time is spent
+    # waiting on pdflatex, so threads are enough to overlap the builds.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(
+                _build_statement_content,
+                statement,
+                pkg,
+                output_type=output,
+                samples=samples,
+            )
+            for statement in statements
+        ]
+        # Statements of different languages might share the same output
+        # path, so results are written one at a time, in language order.
+        for statement, future in zip(statements, futures):
+            content, last_output = future.result()
+            _write_statement(statement, content, last_output)
 
 
 @app.callback()
@@ -0,0 +1,78 @@
+import pathlib
+
+import pytest
+
+import robox
+from robox.box import schema as box_schema
+from robox.box.schema import Package
+from robox.box.statements.build_statements import (
+    _get_code_fingerprint,
+    _get_statement_digest,
+    _get_step_digest,
+    _prune_step_cache,
+    get_builder,
+)
+from robox.box.statements.builders import StatementBuilderProblem
+from robox.box.statements.schema import Statement, StatementType
+
+
+def _get_digest(tmp_path: pathlib.Path) -> str:
+    statement = Statement(
+        title='Problem',
+        path=tmp_path / 'statement.rbx.tex',
+        type=StatementType.roboxTeX,
+    )
+    problem = StatementBuilderProblem(
+        package=Package(name='problem', timeLimit=1000, memoryLimit=256),
+        statement=statement,
+        samples=[
+            box_schema.Testcase(
+                inputPath=tmp_path / 'sample.in', outputPath=tmp_path / 'sample.out'
+            )
+        ],
+    )
+    assets = [(tmp_path / 'image.png', pathlib.Path('image.png'))]
+    statement_digest = _get_statement_digest(assets, [], problem)
+    bdr = get_builder('tex2pdf')
+    return _get_step_digest(bdr, bdr.default_params(), b'input', [], statement_digest)
+
+
+@pytest.fixture
+def statement_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / 'image.png').write_bytes(b'image')
+    (tmp_path / 'sample.in').write_text('1 2\n')
+    (tmp_path / 'sample.out').write_text('3\n')
+    return tmp_path
+
+
+def test_step_digest_is_stable(statement_dir: pathlib.Path):
+    assert _get_digest(statement_dir) == _get_digest(statement_dir)
+
+
+def test_step_digest_changes_with_asset(statement_dir: pathlib.Path):
+    digest = _get_digest(statement_dir)
+    (statement_dir / 'image.png').write_bytes(b'other image')
+    assert _get_digest(statement_dir) != digest
+
+
+def test_step_digest_changes_with_sample(statement_dir: pathlib.Path):
+    digest = _get_digest(statement_dir)
+    (statement_dir / 'sample.out').write_text('42\n')
+    assert _get_digest(statement_dir) != digest
+
+
+def test_step_digest_changes_with_version(
+    statement_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    digest = _get_digest(statement_dir)
+    monkeypatch.setattr(robox, '__version__', 'other')
+    _get_code_fingerprint.cache_clear()  # type: ignore
+    assert _get_digest(statement_dir) != digest
+    _get_code_fingerprint.cache_clear()  # type: ignore
+
+
+def test_prune_step_cache(tmp_path: pathlib.Path):
+    for name in ['old', 'new', '.new.tmp']:
+        (tmp_path / name).touch()
+    _prune_step_cache(tmp_path, keep='new')
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['.new.tmp', 'new']
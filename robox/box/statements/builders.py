@@ -1,17 +1,21 @@
 import dataclasses
+import os
 import pathlib
 import shutil
 import tempfile
 import typing
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import jinja2
 import typer
+from jinja2.loaders import split_template_path
 
 from robox import console
 from robox.box.schema import Package, Testcase
 from robox.box.statements.latex import Latex
 from robox.box.statements.latex_jinja import (
+    create_jinja_env,
     render_latex_template,
     render_latex_template_blocks,
 )
@@ -59,61 +63,89 @@ class StatementBuilderProblem:
         }
 
 
-def prepare_assets(
-    assets: List[Tuple[pathlib.Path, pathlib.Path]],
-    dest_dir: pathlib.Path,
-):
-    dest_dir.mkdir(parents=True, exist_ok=True)
+_INPUT_TEMPLATE = '__input__.tex'
 
-    for asset_in, asset_out in assets:
+
+def _check_assets_exist(assets: List[Tuple[pathlib.Path, pathlib.Path]]):
+    for asset_in, _ in assets:
         if not asset_in.is_file():
             console.console.print(
                 f'[error]Asset [item]{asset_in}[/item] does not exist in your package.[/error]'
             )
             raise typer.Exit(1)
 
+
+def prepare_assets(
+    assets: List[Tuple[pathlib.Path, pathlib.Path]],
+    dest_dir: pathlib.Path,
+):
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    _check_assets_exist(assets)
+
+    for asset_in, asset_out in assets:
         # dest_path = dest_dir / asset.resolve().relative_to(statement_dir)
         dest_path = dest_dir / asset_out
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copyfile(str(asset_in), str(dest_path))
+        # The same asset might be listed more than once, in which case the
+        # last one wins, as it would when copying.
+        dest_path.unlink(missing_ok=True)
+        # Assets are only read from the staging directory, so a hardlink is
+        # enough when both sit on the same filesystem.
+        try:
+            os.link(asset_in, dest_path)
+        except OSError:
+            # Hardlinks can fail for many reasons (other filesystem, link
+            # count limit, permissions), and a copy might still work.
+            shutil.copyfile(str(asset_in), str(dest_path))
+
+
+def _get_jinja_env(
+    assets: List[Tuple[pathlib.Path, pathlib.Path]], content: bytes
+) -> jinja2.Environment:
+    # Serve the input from memory and assets from where they live, instead of
+    # staging everything in a temporary directory. Names are resolved the same
+    # way a `FileSystemLoader` rooted at such a directory would.
+    _check_assets_exist(assets)
+    asset_paths = {
+        '/'.join(split_template_path(str(asset_out))): asset_in
+        for asset_in, asset_out in assets
+    }
+
+    def load_asset(name: str) -> Optional[str]:
+        asset_in = asset_paths.get('/'.join(split_template_path(name)))
+        if asset_in is None:
+            return None
+        return asset_in.read_text(encoding='utf-8')
+
+    loader = jinja2.ChoiceLoader(
+        [
+            jinja2.DictLoader({_INPUT_TEMPLATE: content.decode()}),
+            jinja2.FunctionLoader(load_asset),
+        ]
+    )
+    return create_jinja_env(loader)
 
 
 def render_jinja(
     assets: List[Tuple[pathlib.Path, pathlib.Path]], content: bytes, **kwargs
 ) -> bytes:
-    with tempfile.TemporaryDirectory() as td:
-        temp_dir = pathlib.Path(td)
-        prepare_assets(assets, temp_dir)
-
-        temp_file = '__input__.tex'
-        temp_path = temp_dir / temp_file
-        temp_path.write_bytes(content)
-
-        result: str = render_latex_template(
-            str(temp_dir),
-            temp_file,
-            kwargs,
-        )
-        return result.encode()
+    result: str = render_latex_template(
+        _get_jinja_env(assets, content),
+        _INPUT_TEMPLATE,
+        kwargs,
+    )
+    return result.encode()
 
 
 def render_jinja_blocks(
     assets: List[Tuple[pathlib.Path, pathlib.Path]], content: bytes, **kwargs
 ) -> Dict[str, str]:
-    with tempfile.TemporaryDirectory() as td:
-        temp_dir = pathlib.Path(td)
-        prepare_assets(assets, temp_dir)
-
-        temp_file = '__input__.tex'
-        temp_path = temp_dir / temp_file
-        temp_path.write_bytes(content)
-
-        result: Dict[str, str] = render_latex_template_blocks(
-            str(temp_dir),
-            temp_file,
-            kwargs,
-        )
-        return result
+    result: Dict[str, str] = render_latex_template_blocks(
+        _get_jinja_env(assets, content),
+        _INPUT_TEMPLATE,
+        kwargs,
+    )
+    return result
 
 
 class StatementBuilder(ABC):
@@ -207,23 +239,25 @@ class roboxTeXBuilder(StatementBuilder):
     ) -> bytes:
         params = typing.cast(roboxToTeX, context.params)
         assert params.template is not None
-        blocks = render_jinja_blocks(
-            context.assets, input, **problem.build_jinja_kwargs()
-        )
+        # Both passes share a single environment, so the loader is only set
+        # up once and templates parsed by the first pass are reused.
+        j2_env = _get_jinja_env(context.assets, input)
+        problem_kwargs = problem.build_jinja_kwargs()
+        blocks = render_latex_template_blocks(j2_env, _INPUT_TEMPLATE, problem_kwargs)
 
         input_str = f'%- extends "{params.template}"'
         problems = [
             {
                 'blocks': blocks,
-                **problem.build_jinja_kwargs(),
+                **problem_kwargs,
             }
         ]
-        return render_jinja(
-            context.assets,
-            input_str.encode(),
-            **context.build_jinja_kwargs(),
-            problems=problems,
+        result: str = render_latex_template(
+            j2_env,
+            j2_env.from_string(input_str),
+            {**context.build_jinja_kwargs(), 'problems': problems},
         )
+        return result.encode()
 
 
 class TeX2PDFBuilder(StatementBuilder):
@@ -250,7 +284,7 @@ class TeX2PDFBuilder(StatementBuilder):
         with tempfile.TemporaryDirectory() as td:
             temp_dir = pathlib.Path(td)
             prepare_assets(context.assets, temp_dir)
-            latex_result = latex.build_pdf(temp_dir)
+            latex_result = latex.build_pdf(temp_dir, capture_stdout=verbose)
         pdf = latex_result.pdf
         if pdf is None:
             console.console.print(f'{latex_result.result.stdout.decode()}')
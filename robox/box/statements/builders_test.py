@@ -0,0 +1,48 @@
+import errno
+import os
+import pathlib
+
+import pytest
+
+from robox.box.statements.builders import prepare_assets, render_jinja
+
+
+def test_prepare_assets_with_repeated_asset(tmp_path: pathlib.Path):
+    asset = tmp_path / 'img' / 'a.png'
+    asset.parent.mkdir()
+    asset.write_bytes(b'png')
+    link = tmp_path / 'link.png'
+    link.symlink_to(asset)
+
+    dest_dir = tmp_path / 'dest'
+    prepare_assets(
+        [(asset, pathlib.Path('a.png')), (link, pathlib.Path('a.png'))], dest_dir
+    )
+    assert (dest_dir / 'a.png').read_bytes() == b'png'
+    assert asset.read_bytes() == b'png'
+
+
+def test_render_jinja_reads_assets_as_utf8(tmp_path: pathlib.Path):
+    template = tmp_path / 'template.tex'
+    template.write_bytes('Olá, \\VAR{name}!'.encode('utf-8'))
+
+    content = b'\\BLOCK{ include "template.tex" }'
+    result = render_jinja(
+        [(template, pathlib.Path('template.tex'))], content, name='mundo'
+    )
+    assert result.decode() == 'Olá, mundo!'
+
+
+def test_prepare_assets_copies_when_link_fails(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    asset = tmp_path / 'a.png'
+    asset.write_bytes(b'png')
+
+    def failing_link(*args, **kwargs):
+        raise OSError(errno.EMLINK, 'Too many links')
+
+    monkeypatch.setattr(os, 'link', failing_link)
+    dest_dir = tmp_path / 'dest'
+    prepare_assets([(asset, pathlib.Path('a.png'))], dest_dir)
+    assert (dest_dir / 'a.png').read_bytes() == b'png'
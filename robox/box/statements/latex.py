@@ -14,14 +14,27 @@ class Latex:
     def __init__(self, latex: str):
         self.latex = latex
 
-    def build_pdf(self, temp_dir: pathlib.Path) -> LatexResult:
+    def build_pdf(
+        self, temp_dir: pathlib.Path, capture_stdout: bool = True
+    ) -> LatexResult:
         temp_path = temp_dir / 'statement.tex'
         output_path = temp_path.with_suffix('.pdf')
+        log_path = temp_path.with_suffix('.log')
         args = ['pdflatex', '-interaction', 'nonstopmode', str(temp_path)]
         temp_path.write_text(self.latex)
 
-        completed = subprocess.run(args, timeout=15, capture_output=True, cwd=temp_dir)
+        completed = subprocess.run(
+            args,
+            timeout=15,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            cwd=temp_dir,
+        )
         if completed.returncode != 0 or not output_path.exists():
+            if not capture_stdout:
+                # pdflatex writes its whole output to the log file as well,
+                # so only read it back when it is going to be shown.
+                completed.stdout = log_path.read_bytes() if log_path.is_file() else b''
             return LatexResult(result=completed, pdf=None)
 
         return LatexResult(result=completed, pdf=output_path.read_bytes())
@@ -122,22 +122,26 @@ def add_builtin_filters(j2_env: jinja2.Environment):
     j2_env.filters['sci'] = scientific_notation
 
 
-def render_latex_template(path_templates, template_filename, template_vars=None) -> str:
+def create_jinja_env(loader: jinja2.BaseLoader) -> jinja2.Environment:
+    j2_env = jinja2.Environment(
+        loader=loader,
+        **J2_ARGS,
+        undefined=jinja2.StrictUndefined,
+    )
+    add_builtin_filters(j2_env)
+    return j2_env
+
+
+def render_latex_template(j2_env, template_filename, template_vars=None) -> str:
     """Render a latex template, filling in its template variables
 
-    :param path_templates: the path to the template directory
-    :param template_filename: the name, rooted at the path_template_directory,
-        of the desired template for rendering
+    :param j2_env: the jinja2 environment, as created by create_jinja_env
+    :param template_filename: the name, as known by the environment loader,
+        of the desired template for rendering, or the template itself
     :param template_vars: dictionary of key:val for jinja2 variables
         defaults to None for case when no values need to be passed
     """
     var_dict = template_vars if template_vars else {}
-    j2_env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(path_templates),
-        **J2_ARGS,
-        undefined=jinja2.StrictUndefined,
-    )
-    add_builtin_filters(j2_env)
     template = j2_env.get_template(template_filename)
     try:
         return template.render(**var_dict)  # type: ignore
@@ -151,23 +155,17 @@ def render_latex_template(path_templates, template_filename, template_vars=None)
 
 
 def render_latex_template_blocks(
-    path_templates, template_filename, template_vars=None
+    j2_env, template_filename, template_vars=None
 ) -> Dict[str, str]:
     """Render a latex template, filling in its template variables
 
-    :param path_templates: the path to the template directory
-    :param template_filename: the name, rooted at the path_template_directory,
-        of the desired template for rendering
+    :param j2_env: the jinja2 environment, as created by create_jinja_env
+    :param template_filename: the name, as known by the environment loader,
+        of the desired template for rendering, or the template itself
     :param template_vars: dictionary of key:val for jinja2 variables
         defaults to None for case when no values need to be passed
     """
     var_dict = template_vars if template_vars else {}
-    j2_env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(path_templates),
-        **J2_ARGS,
-        undefined=jinja2.StrictUndefined,
-    )
-    add_builtin_filters(j2_env)
     template = j2_env.get_template(template_filename)
     ctx = template.new_context(var_dict)  # type: ignore
     try:
@@ -33,16 +33,18 @@ class StatementType(AutoEnum):
     PDF = alias('pdf')
 
     def get_file_suffix(self) -> str:
-        match self:
-            case StatementType.TeX:
-                return '.tex'
-            case StatementType.roboxTeX:
-                return '.rbx.tex'
-            case StatementType.JinjaTeX:
-                return '.jinja.tex'
-            case StatementType.PDF:
-                return '.pdf'
-        raise ValueError(f'Unknown statement type: {self}')
+        suffix = _FILE_SUFFIXES.get(self)
+        if suffix is None:
+            raise ValueError(f'Unknown statement type: {self}')
+        return suffix
+
+
+_FILE_SUFFIXES = {
+    StatementType.TeX: '.tex',
+    StatementType.roboxTeX: '.rbx.tex',
+    StatementType.JinjaTeX: '.jinja.tex',
+    StatementType.PDF: '.pdf',
+}
 
 
 class Statement(BaseModel):
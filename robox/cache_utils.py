@@ -0,0 +1,44 @@
+import functools
+from typing import Any, Callable, Dict, List
+
+# Every cache dict used with `memoize`, so all of them can be dropped at once.
+_REGISTRY: List[Dict[Any, Any]] = []
+
+
+def register(cache: Dict[Any, Any]):
+    """Register `cache` to be dropped by `clear_all`."""
+    if not any(registered is cache for registered in _REGISTRY):
+        _REGISTRY.append(cache)
+
+
+def memoize(cache: Dict[Any, Any]) -> Callable[[Callable], Callable]:
+    """Memoize a function into `cache`, keyed by function name and arguments."""
+    register(cache)
+
+    def decorator(fn: Callable) -> Callable:
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            res = fn(*args, **kwargs)
+            cache[key] = res
+            return res
+
+        def cache_clear():
+            for key in [key for key in cache if key[0] == name]:
+                del cache[key]
+
+        wrapper.cache_clear = cache_clear  # type: ignore
+        return wrapper
+
+    return decorator
+
+
+def clear_all():
+    for cache in _REGISTRY:
+        cache.clear()
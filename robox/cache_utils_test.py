@@ -0,0 +1,36 @@
+from typing import Any, Dict, List
+
+from robox import cache_utils
+
+
+def test_memoize():
+    cache: Dict[Any, Any] = {}
+    calls: List[int] = []
+
+    @cache_utils.memoize(cache)
+    def double(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    @cache_utils.memoize(cache)
+    def triple(x: int) -> int:
+        calls.append(x)
+        return x * 3
+
+    assert double(1) == 2
+    assert double(1) == 2
+    assert double(x=1) == 2
+    assert triple(1) == 3
+    assert calls == [1, 1, 1]
+
+    # Only clears results of the given function.
+    double.cache_clear()  # type: ignore
+    assert double(1) == 2
+    assert triple(1) == 3
+    assert calls == [1, 1, 1, 1]
+
+    cache_utils.clear_all()
+    assert not cache
+    assert double(1) == 2
+    assert triple(1) == 3
+    assert calls == [1, 1, 1, 1, 1, 1]
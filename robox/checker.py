@@ -54,6 +54,7 @@ def add(
     if not problem_path:
         raise typer.Exit(1)
     problem_path.write_text(utils.model_json(problem_to_dump))
+    metadata.invalidate_problem_paths()
     console.print(
         f'Checker [item]{checker_name}[/item] added to problem [item]{dumped_problem.pretty_name()}[/item].'
     )
@@ -75,6 +76,7 @@ def set(problem: annotations.Problem, checker: annotations.Checker):
     if not problem_path:
         raise typer.Exit(1)
     problem_path.write_text(utils.model_json(problem_to_dump))
+    metadata.invalidate_problem_paths()
     console.print(
         f'Checker [item]{checker}[/item] will be used for problem [item]{dumped_problem.pretty_name()}[/item].'
     )
@@ -96,6 +98,7 @@ def unset(problem: annotations.Problem):
     if not problem_path:
         raise typer.Exit(1)
     problem_path.write_text(utils.model_json(problem_to_dump))
+    metadata.invalidate_problem_paths()
     console.print(
         f'Default checker will be used for problem [item]{dumped_problem.pretty_name()}[/item].'
     )
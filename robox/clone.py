@@ -66,6 +66,7 @@ def create_problem_structure(
             return None
 
     json_path.write_text(utils.model_json(problem_to_dump))
+    metadata.invalidate_problem_paths()
     code = jinja2.Template(lang.get_template()).render(**problem_to_dump.get_vars())
     code_path.write_text(code)
 
@@ -1,32 +1,42 @@
-import functools
+import contextlib
 import importlib
 import importlib.resources
 import os
 import pathlib
+import re
 import shutil
 import subprocess
-from typing import Any, Dict, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional
 
 import requests
 import typer
 from pydantic import BaseModel
 
-from robox import utils
+from robox import cache_utils, utils
 from robox.console import console
-from robox.grading.judge.storage import copyfileobj
+
+try:
+    from importlib.resources.abc import Traversable
+except ImportError:
+    # Python 3.10 only exposes it from importlib.abc.
+    from importlib.abc import Traversable  # type: ignore
 
 app = typer.Typer(no_args_is_help=True)
 
 _RESOURCES_PKG = 'resources'
 _CONFIG_FILE_NAME = 'default_config.json'
 
+_CACHE: Dict[Any, Any] = {}
+
+
+_VAR_PATTERN = re.compile(r'%\{([^}]*)\}')
+
 
 def format_vars(template: str, **kwargs) -> str:
-    res = template
-    for key, value in kwargs.items():
-        key = key.replace('_', '-')
-        res = res.replace(f'%{{{key}}}', value)
-    return res
+    values = {key.replace('_', '-'): value for key, value in kwargs.items()}
+    return _VAR_PATTERN.sub(
+        lambda match: values.get(match.group(1), match.group(0)), template
+    )
 
 
 class Artifact(BaseModel):
@@ -86,24 +96,33 @@ def get_app_path() -> pathlib.Path:
 
 def get_empty_app_persist_path() -> pathlib.Path:
     app_dir = get_app_path() / 'persist'
-    shutil.rmtree(str(app_dir), ignore_errors=True)
+    utils.rmtree_in_background(app_dir)
     app_dir.mkdir(parents=True, exist_ok=True)
     return app_dir
 
 
+@cache_utils.memoize(_CACHE)
+def _get_resources_root() -> Traversable:
+    return importlib.resources.files(_RESOURCES_PKG)
+
+
+def _get_resource_as_file(path: pathlib.Path | str) -> ContextManager[pathlib.Path]:
+    resource = _get_resources_root() / str(path)
+    if isinstance(resource, pathlib.Path):
+        # Resources installed as regular files can be used in place.
+        return contextlib.nullcontext(resource)
+    return importlib.resources.as_file(resource)
+
+
 def get_app_file(path: pathlib.Path) -> pathlib.Path:
     file_path = get_app_path() / path
     if file_path.is_file():
         return file_path
 
-    with importlib.resources.as_file(
-        importlib.resources.files(_RESOURCES_PKG) / path  # type: ignore
-    ) as file:
+    with _get_resource_as_file(path) as file:
         if file.is_file():
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            with file.open('rb') as fr:
-                with file_path.open('wb') as fw:
-                    copyfileobj(fr, fw)
+            shutil.copyfile(file, file_path)
     return file_path
 
 
@@ -169,9 +188,7 @@ def get_jngen() -> pathlib.Path:
 
 
 def get_default_config_path() -> pathlib.Path:
-    with importlib.resources.as_file(
-        importlib.resources.files(_RESOURCES_PKG) / _CONFIG_FILE_NAME
-    ) as file:
+    with _get_resource_as_file(_CONFIG_FILE_NAME) as file:
         return file
 
 
@@ -180,7 +197,7 @@ def get_default_app_path() -> pathlib.Path:
 
 
 def get_default_config() -> Config:
-    return Config.model_validate_json(get_default_config_path().read_text())
+    return Config.model_validate_json(get_default_config_path().read_bytes())
 
 
 def get_config_path() -> pathlib.Path:
@@ -198,12 +215,12 @@ def open_editor(path: pathlib.Path, *args):
     subprocess.run([editor, str(path), *[str(arg) for arg in args]])
 
 
-@functools.cache
+@cache_utils.memoize(_CACHE)
 def get_config() -> Config:
     config_path = get_config_path()
     if not config_path.is_file():
         utils.create_and_write(config_path, utils.model_json(get_default_config()))
-    return Config.model_validate_json(config_path.read_text())
+    return Config.model_validate_json(config_path.read_bytes())
 
 
 def save_config(cfg: Config):
@@ -226,7 +243,9 @@ def list():
     """
     Pretty print the config file.
     """
-    console.print_json(utils.model_json(get_config()))
+    console.print_json(
+        data=get_config().model_dump(mode='json', exclude_unset=True, exclude_none=True)
+    )
 
 
 @app.command()
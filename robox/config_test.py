@@ -0,0 +1,12 @@
+from robox.config import format_vars
+
+
+def test_format_vars():
+    assert (
+        format_vars('%{problem-code}.cpp -> %{file}', problem_code='A', file='a.cpp')
+        == 'A.cpp -> a.cpp'
+    )
+
+
+def test_format_vars_keeps_unknown_vars():
+    assert format_vars('%{unknown} %{file}', file='a.cpp') == '%{unknown} a.cpp'
@@ -151,7 +151,7 @@ class FileCacher:
         ftmp_handle, temp_file_path = tempfile.mkstemp(dir=self.temp_dir, text=False)
         temp_file_path = pathlib.Path(temp_file_path)
         with open(ftmp_handle, 'wb') as ftmp, self.backend.get_file(digest) as fobj:
-            storage.copyfileobj(fobj, ftmp, self.CHUNK_SIZE)
+            storage.copyfile_between_fds(fobj, ftmp, self.CHUNK_SIZE)
 
         if not cache_only:
             # We allow anyone to delete files from the cache directory
@@ -253,7 +253,7 @@ class FileCacher:
         if digest == storage.TOMBSTONE:
             raise TombstoneError()
         with self.get_file(digest) as src:
-            storage.copyfileobj(src, dst, self.CHUNK_SIZE)
+            storage.copyfile_between_fds(src, dst, self.CHUNK_SIZE)
 
     def get_file_to_path(self, digest: str, dst_path: pathlib.Path):
         """Retrieve a file from the storage.
@@ -272,7 +272,7 @@ class FileCacher:
             raise TombstoneError()
         with self.get_file(digest) as src:
             with dst_path.open('wb') as dst:
-                storage.copyfileobj(src, dst, self.CHUNK_SIZE)
+                storage.copyfile_between_fds(src, dst, self.CHUNK_SIZE)
 
     def put_file_from_fobj(self, src: IO[bytes], desc: str = '') -> str:
         """Store a file in the storage.
@@ -333,7 +333,7 @@ class FileCacher:
             with open(dst.name, 'rb') as src:
                 pending_file = self.backend.create_file(digest)
                 if pending_file is not None:
-                    storage.copyfileobj(src, pending_file.fd, self.CHUNK_SIZE)
+                    storage.copyfile_between_fds(src, pending_file.fd, self.CHUNK_SIZE)
                     self.backend.commit_file(pending_file, desc)
 
             os.rename(dst.name, cache_file_path)
@@ -0,0 +1,31 @@
+import io
+import os
+import pathlib
+
+import pytest
+
+from robox.grading.judge import cacher, storage
+
+
+@pytest.mark.parametrize('has_copy_file_range', [True, False])
+def test_file_cacher_copies(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, has_copy_file_range: bool
+):
+    if not has_copy_file_range:
+        monkeypatch.delattr(os, 'copy_file_range', raising=False)
+    content = b'hello world\n' * 1000
+    src_path = tmp_path / 'src'
+    src_path.write_bytes(content)
+
+    backend = storage.FilesystemStorage(tmp_path / 'storage')
+    digest = cacher.FileCacher(backend).put_file_from_path(src_path)
+
+    # A fresh cacher has to load the file from the backend.
+    file_cacher = cacher.FileCacher(backend)
+    dst_path = tmp_path / 'dst'
+    file_cacher.get_file_to_path(digest, dst_path)
+    assert dst_path.read_bytes() == content
+
+    dst = io.BytesIO()
+    file_cacher.get_file_to_fobj(digest, dst)
+    assert dst.getvalue() == content
@@ -11,8 +11,6 @@ import sys
 import typing
 from typing import IO, Dict, List, Optional, Union
 
-import pydantic
-
 from robox.grading.judge import cacher, storage
 
 logger = logging.getLogger(__name__)
@@ -80,7 +78,8 @@ class DirectoryMount:
     options: Optional[str] = None
 
 
-class SandboxParams(pydantic.BaseModel):
+@dataclasses.dataclass(slots=True)
+class SandboxParams:
     """Parameters for the sandbox.
 
     box_id (int): the id of the sandbox.
@@ -97,10 +96,10 @@ class SandboxParams(pydantic.BaseModel):
 
     fsize: Optional[int] = None  # KiB
     cgroup: bool = False
-    dirs: List[DirectoryMount] = []
+    dirs: List[DirectoryMount] = dataclasses.field(default_factory=list)
     preserve_env: bool = False
-    inherit_env: List[str] = []
-    set_env: Dict[str, str] = {}
+    inherit_env: List[str] = dataclasses.field(default_factory=list)
+    set_env: Dict[str, str] = dataclasses.field(default_factory=dict)
     verbosity: int = 0
     max_processes: Optional[int] = 1
 
@@ -334,16 +333,16 @@ class SandboxBase(abc.ABC):
         """
         return self.get_root_path() / path
 
-    def create_file(
+    def _create_file_fd(
         self, path: pathlib.Path, executable: bool = False, override: bool = False
-    ) -> IO[bytes]:
-        """Create an empty file in the sandbox and open it in write
-        binary mode.
+    ) -> int:
+        """Create an empty file in the sandbox and return a file
+        descriptor open for writing.
 
         path (Path): relative path of the file inside the sandbox.
         executable (bool): to set permissions.
 
-        return (file): the file opened in write binary mode.
+        return (int): the file descriptor.
 
         """
         if executable:
@@ -355,7 +354,6 @@ class SandboxBase(abc.ABC):
             real_path.unlink(missing_ok=True)
         try:
             file_fd = os.open(str(real_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-            file_ = open(file_fd, 'wb')
         except OSError as e:
             logger.error(
                 'Failed create file %s in sandbox. Unable to '
@@ -369,8 +367,22 @@ class SandboxBase(abc.ABC):
         mod = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH | stat.S_IWUSR
         if executable:
             mod |= stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
-        os.chmod(str(real_path), mod)
-        return file_
+        os.fchmod(file_fd, mod)
+        return file_fd
+
+    def create_file(
+        self, path: pathlib.Path, executable: bool = False, override: bool = False
+    ) -> IO[bytes]:
+        """Create an empty file in the sandbox and open it in write
+        binary mode.
+
+        path (Path): relative path of the file inside the sandbox.
+        executable (bool): to set permissions.
+
+        return (file): the file opened in write binary mode.
+
+        """
+        return open(self._create_file_fd(path, executable, override=override), 'wb')
 
     def create_file_from_storage(
         self,
@@ -392,7 +404,7 @@ class SandboxBase(abc.ABC):
     def create_file_from_bytes(
         self,
         path: pathlib.Path,
-        content: bytes,
+        content: bytes | bytearray | memoryview,
         executable: bool = False,
         override: bool = False,
     ):
@@ -403,8 +415,15 @@ class SandboxBase(abc.ABC):
         executable (bool): to set permissions.
 
         """
-        with self.create_file(path, executable, override=override) as dest_fobj:
-            dest_fobj.write(content)
+        # Write the buffer straight to the descriptor, as there is no
+        # point in going through a buffered file object for a single write.
+        file_fd = self._create_file_fd(path, executable, override=override)
+        try:
+            view = memoryview(content)
+            while view:
+                view = view[os.write(file_fd, view) :]
+        finally:
+            os.close(file_fd)
 
     def create_file_from_string(
         self,
@@ -436,7 +455,7 @@ class SandboxBase(abc.ABC):
         return (file): the file opened in read binary mode.
 
         """
-        logger.debug(f'Retrieving file {path} from sandbox.')
+        logger.debug('Retrieving file %s from sandbox.', path)
         real_path = self.relative_path(path)
         file_ = real_path.open('rb')
         if trunc_len is not None:
@@ -477,11 +496,26 @@ class SandboxBase(abc.ABC):
         return (bytes): the content of the file up to maxlen bytes.
 
         """
-        with self.get_file(path) as file_:
-            if maxlen is None:
+        if maxlen is None:
+            with self.get_file(path) as file_:
                 return file_.read()
-            else:
-                return file_.read(maxlen)
+        return self._read_raw(path, maxlen)
+
+    def _read_raw(self, path: pathlib.Path, maxlen: int) -> bytes:
+        # Bounded reads skip the buffered reader and go straight to the fd.
+        logger.debug('Retrieving file %s from sandbox.', path)
+        fd = os.open(self.relative_path(path), os.O_RDONLY)
+        try:
+            chunks = []
+            while maxlen > 0:
+                chunk = os.read(fd, maxlen)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                maxlen -= len(chunk)
+            return b''.join(chunks)
+        finally:
+            os.close(fd)
 
     def get_file_to_string(
         self, path: pathlib.Path, maxlen: Optional[int] = 1024
@@ -631,6 +665,8 @@ class Truncator(io.RawIOBase):
         """
         self.fobj = fobj
         self.size = size
+        # Track the position ourselves, to avoid calling tell() on every read.
+        self._pos = fobj.tell()
 
     def close(self):
         """See io.IOBase.close."""
@@ -655,8 +691,13 @@ class Truncator(io.RawIOBase):
         # the given buffer so that it doesn't overflow into the area we
         # want to hide (that is, out of the prefix) and then we forward
         # it to the wrapped file-like object.
-        b = memoryview(b)[: max(0, self.size - self.fobj.tell())]
-        return self.fobj.readinto(b)
+        remaining = max(0, self.size - self._pos)
+        if len(b) > remaining:
+            b = memoryview(b)[:remaining]
+        n = self.fobj.readinto(b)
+        if n:
+            self._pos += n
+        return n
 
     def seek(self, offset, whence=io.SEEK_SET):
         """See io.IOBase.seek."""
@@ -665,13 +706,14 @@ class Truncator(io.RawIOBase):
         if whence == io.SEEK_END:
             if self.fobj.seek(0, io.SEEK_END) > self.size:
                 self.fobj.seek(self.size, io.SEEK_SET)
-            return self.fobj.seek(offset, io.SEEK_CUR)
+            self._pos = self.fobj.seek(offset, io.SEEK_CUR)
         else:
-            return self.fobj.seek(offset, whence)
+            self._pos = self.fobj.seek(offset, whence)
+        return self._pos
 
     def tell(self):
         """See io.IOBase.tell."""
-        return self.fobj.tell()
+        return self._pos
 
     def write(self, _):
         """See io.RawIOBase.write."""
@@ -1,6 +1,7 @@
 import dataclasses
 import io
 import logging
+import os
 import pathlib
 import tempfile
 from abc import ABC, abstractmethod
@@ -47,6 +48,64 @@ def copyfileobj(
         gevent.sleep(0)
 
 
+def copyfile_between_fds(
+    source_fobj: IO[bytes],
+    destination_fobj: IO[bytes],
+    buffer_size=io.DEFAULT_BUFFER_SIZE,
+):
+    """Copy all content from one binary file object to another.
+    When both objects are backed by regular files, the copy is done
+    in-kernel with copy_file_range(2), starting from their current
+    positions, and both objects are moved past the copied content
+    afterwards, as with copyfileobj(). Otherwise, if the platform lacks
+    copy_file_range(2), or if the kernel refuses the operation before
+    anything is copied, fall back to copyfileobj().
+    source_fobj (fileobj): a binary file object open for reading.
+    destination_fobj (fileobj): a binary file object open for writing.
+    buffer_size (int): the size of the read/write buffer for the fallback.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        copyfileobj(source_fobj, destination_fobj, buffer_size)
+        return
+
+    try:
+        source_fd = source_fobj.fileno()
+        destination_fd = destination_fobj.fileno()
+        destination_fobj.flush()
+        # Buffered objects might have read ahead of their logical position,
+        # so the offsets of the descriptors cannot be relied upon.
+        source_offset = source_fobj.tell()
+        destination_offset = destination_fobj.tell()
+    except (AttributeError, OSError):
+        copyfileobj(source_fobj, destination_fobj, buffer_size)
+        return
+
+    copied = 0
+    while True:
+        try:
+            n = os.copy_file_range(
+                source_fd,
+                destination_fd,
+                1 << 30,
+                source_offset + copied,
+                destination_offset + copied,
+            )
+        except OSError:
+            if copied > 0:
+                raise
+            copyfileobj(source_fobj, destination_fobj, buffer_size)
+            return
+        if n == 0:
+            break
+        copied += n
+        # Cooperative yield.
+        gevent.sleep(0)
+
+    # Also syncs buffered objects with their descriptors.
+    source_fobj.seek(source_offset + copied)
+    destination_fobj.seek(destination_offset + copied)
+
+
 @dataclasses.dataclass
 class PendingFile:
     fd: IO[bytes]
@@ -0,0 +1,67 @@
+import os
+import pathlib
+
+import pytest
+
+from robox.grading.judge.storage import copyfile_between_fds
+
+
+def _copy(tmp_path: pathlib.Path, content: bytes) -> bytes:
+    source = tmp_path / 'source'
+    destination = tmp_path / 'destination'
+    source.write_bytes(content)
+    with source.open('rb') as source_fobj, destination.open('wb') as dest_fobj:
+        copyfile_between_fds(source_fobj, dest_fobj)
+    return destination.read_bytes()
+
+
+def test_copyfile_between_fds(tmp_path: pathlib.Path):
+    assert _copy(tmp_path, b'hello world\n' * 1000) == b'hello world\n' * 1000
+    assert _copy(tmp_path, b'') == b''
+
+
+def test_copyfile_between_fds_without_copy_file_range(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.delattr(os, 'copy_file_range', raising=False)
+    assert _copy(tmp_path, b'hello world\n' * 1000) == b'hello world\n' * 1000
+
+
+@pytest.mark.skipif(
+    not hasattr(os, 'copy_file_range'), reason='requires copy_file_range'
+)
+def test_copyfile_between_fds_partial_copies(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    copy_file_range = os.copy_file_range
+    copied = []
+
+    def short_copy_file_range(src: int, dst: int, count: int, *args) -> int:
+        n = copy_file_range(src, dst, min(count, 7), *args)
+        copied.append(n)
+        return n
+
+    monkeypatch.setattr(os, 'copy_file_range', short_copy_file_range)
+    assert _copy(tmp_path, b'0123456789' * 10) == b'0123456789' * 10
+    assert copied == [7] * 14 + [2, 0]
+
+
+@pytest.mark.parametrize('has_copy_file_range', [True, False])
+def test_copyfile_between_fds_keeps_positions(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, has_copy_file_range: bool
+):
+    if not has_copy_file_range:
+        monkeypatch.delattr(os, 'copy_file_range', raising=False)
+    source = tmp_path / 'source'
+    destination = tmp_path / 'destination'
+    source.write_bytes(b'0123456789' * 1000)
+    with source.open('rb') as source_fobj, destination.open('wb') as dest_fobj:
+        # Buffers more than it returns.
+        assert source_fobj.read(5) == b'01234'
+        dest_fobj.write(b'header|')
+        copyfile_between_fds(source_fobj, dest_fobj)
+        dest_fobj.write(b'|footer')
+        assert source_fobj.read() == b''
+    assert destination.read_bytes() == (
+        b'header|' + (b'0123456789' * 1000)[5:] + b'|footer'
+    )
@@ -1,23 +1,58 @@
+import os
 import pathlib
 from typing import List, Optional, Tuple
 
 from robox import config, hydration, metadata
 from robox.console import console
 from robox.schema import DumpedProblem, Testcase
-from robox.test import get_testcases_io
+from robox.test import get_testcases_io, iterate_testcase_files
+
+
+def _get_testcase_names(code: str, i: int) -> Tuple[str, str]:
+    return (f'{code}.{i}.in', f'{code}.{i}.out')
 
 
 def get_testcase_paths(
     root: pathlib.Path, problem: DumpedProblem, i: int
 ) -> Tuple[pathlib.Path, pathlib.Path]:
-    return (root / f'{problem.code}.{i}.in', root / f'{problem.code}.{i}.out')
+    in_name, out_name = _get_testcase_names(problem.code, i)
+    return (root / in_name, root / out_name)
+
+
+def _get_next_testcase_index(root: pathlib.Path, code: str) -> int:
+    indices = [index for index, _, _ in iterate_testcase_files(code, root)]
+    return max(indices, default=-1) + 1
+
+
+def _write_files_at(root: pathlib.Path, files: List[Tuple[str, bytes]]):
+    # Open files relative to a descriptor of the directory, so the path of
+    # the directory is only resolved once.
+    dir_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name, content in files:
+            fd = os.open(
+                name, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o666, dir_fd=dir_fd
+            )
+            try:
+                view = memoryview(content)
+                while view:
+                    view = view[os.write(fd, view) :]
+            finally:
+                os.close(fd)
+    finally:
+        os.close(dir_fd)
 
 
 def hydrate_problem(root: pathlib.Path, problem: DumpedProblem):
+    # Encode everything upfront, so the write loop only does raw I/O.
+    files: List[Tuple[str, bytes]] = []
     for i, testcase in enumerate(problem.tests or []):
-        in_path, out_path = get_testcase_paths(root, problem, i)
-        in_path.write_text(testcase.input)
-        out_path.write_text(testcase.output)
+        in_name, out_name = _get_testcase_names(problem.code, i)
+        files.append((in_name, testcase.input.encode()))
+        files.append((out_name, testcase.output.encode()))
+
+    root.mkdir(parents=True, exist_ok=True)
+    _write_files_at(root, files)
 
 
 def add_testcase(root: pathlib.Path, problem: DumpedProblem, testcase: Testcase):
@@ -29,10 +64,10 @@ def add_testcase(root: pathlib.Path, problem: DumpedProblem, testcase: Testcase)
         return
 
     # Pick next number.
-    i = max([tc.index for tc in get_testcases_io(problem, root)] + [-1]) + 1
+    i = _get_next_testcase_index(root, problem.code)
     in_path, out_path = get_testcase_paths(root, problem, i)
-    in_path.write_text(testcase.input)
-    out_path.write_text(testcase.output)
+    in_path.write_bytes(testcase.input.encode())
+    out_path.write_bytes(testcase.output.encode())
 
     console.print(
         f'Added testcase [item]{i}[/item] to problem [item]{problem.pretty_name()}[/item].'
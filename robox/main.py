@@ -2,12 +2,6 @@ import typer
 from typing_extensions import Annotated
 
 from robox import annotations, checker, config, testcase
-from robox import clone as clone_pkg
-from robox import create as create_pkg
-from robox import edit as edit_pkg
-from robox import run as run_pkg
-from robox import submit as submit_pkg
-from robox import test as test_pkg
 from robox.box import main
 
 app = typer.Typer(no_args_is_help=True, cls=annotations.AliasGroup)
@@ -37,6 +31,8 @@ def clone(lang: annotations.Language):
     """
     Clones by waiting for a set of problems to be sent through Competitive Companion.
     """
+    from robox import clone as clone_pkg
+
     clone_pkg.main(lang=lang)
 
 
@@ -51,6 +47,8 @@ def new(
     """
     Create a new problem from scratch.
     """
+    from robox import create as create_pkg
+
     create_pkg.main(name, language, timelimit, memorylimit, multitest)
 
 
@@ -61,6 +59,8 @@ def edit(
     """
     Edit the code of a problem using the provided language.
     """
+    from robox import edit as edit_pkg
+
     edit_pkg.main(problem, language)
 
 
@@ -75,6 +75,8 @@ def test(
     """
     Test a problem using the provided language.
     """
+    from robox import test as test_pkg
+
     test_pkg.main(
         problem,
         language,
@@ -93,6 +95,8 @@ def run(
     """
     Run a problem using the provided language.
     """
+    from robox import run as run_pkg
+
     run_pkg.main(
         problem,
         language,
@@ -109,6 +113,8 @@ def submit(
     """
     Submit a problem using the provided language.
     """
+    from robox import submit as submit_pkg
+
     submit_pkg.main(problem, language, keep_sandbox=keep_sandbox)
 
 
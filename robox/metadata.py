@@ -1,7 +1,50 @@
+import concurrent.futures
+import os
 import pathlib
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
 
-from robox.schema import DumpedProblem
+from pydantic import BaseModel
+
+from robox import cache_utils
+from robox.schema import DumpedProblem, DumpedProblemSummary
+
+T = TypeVar('T', bound=BaseModel)
+
+_METADATA_SUFFIX = '.rbx.json'
+
+# Metadata files known to exist and problems found by `find_problem_by_anything`.
+# Missing files and problems are not remembered, so files created later in a
+# long running process are still found.
+_CACHE: Dict[Any, Any] = {}
+cache_utils.register(_CACHE)
+
+# Below this many files, a thread pool costs more than it saves.
+_MIN_FILES_FOR_POOL = 4
+
+
+def _load_problem(metadata_path: pathlib.Path, model: Type[T] = DumpedProblem) -> T:
+    return model.model_validate_json(metadata_path.read_bytes())
+
+
+def _iterate_metadata_paths(root: pathlib.Path) -> Iterator[pathlib.Path]:
+    # Cheaper than globbing, since entries are matched by a plain suffix check.
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.endswith(_METADATA_SUFFIX) and entry.is_file():
+                yield root / entry.name
+
+
+def _load_problems(
+    root: pathlib.Path, model: Type[T] = DumpedProblem
+) -> List[Tuple[pathlib.Path, T]]:
+    paths = list(_iterate_metadata_paths(root))
+    if len(paths) < _MIN_FILES_FOR_POOL:
+        return [(path, _load_problem(path, model)) for path in paths]
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        problems = executor.map(lambda path: _load_problem(path, model), paths)
+        return list(zip(paths, problems))
 
 
 def _normalize_alias(alias: str) -> str:
@@ -17,8 +60,8 @@ def _find_alias(alias: str, haystack: List[str]) -> Optional[int]:
 
 
 def _get_best_alias_from_candidates(
-    alias: str, candidates: List[Tuple[pathlib.Path, DumpedProblem]]
-) -> Optional[Tuple[pathlib.Path, DumpedProblem]]:
+    alias: str, candidates: List[Tuple[pathlib.Path, DumpedProblemSummary]]
+) -> Optional[Tuple[pathlib.Path, DumpedProblemSummary]]:
     best_priority = 1e9
     best_candidates = []
     for path, problem in candidates:
@@ -38,14 +81,29 @@ def _get_best_alias_from_candidates(
     return best_candidates[0]
 
 
+def _is_metadata_file(abs_path: str) -> bool:
+    key = ('_is_metadata_file', abs_path)
+    if key in _CACHE:
+        return True
+    if not os.path.isfile(abs_path):
+        return False
+    _CACHE[key] = True
+    return True
+
+
+# Should be called after creating, changing or removing metadata files.
+def invalidate_problem_paths():
+    _CACHE.clear()
+
+
 def find_problem_path_by_code(
     code: str, root: Optional[pathlib.Path] = None
 ) -> Optional[pathlib.Path]:
     if not root:
         root = pathlib.Path()
 
-    metadata_path = root / f'{code}.rbx.json'
-    if not metadata_path.is_file():
+    metadata_path = root / f'{code}{_METADATA_SUFFIX}'
+    if not _is_metadata_file(os.path.abspath(metadata_path)):
         return None
     return metadata_path
 
@@ -56,9 +114,9 @@ def find_problem_path_by_alias(
     if not root:
         root = pathlib.Path()
 
-    candidates: List[Tuple[pathlib.Path, DumpedProblem]] = []
-    for metadata_path in root.glob('*.rbx.json'):
-        problem = DumpedProblem.model_validate_json(metadata_path.read_text())
+    # Only the full metadata of the picked problem needs to be loaded.
+    candidates: List[Tuple[pathlib.Path, DumpedProblemSummary]] = []
+    for metadata_path, problem in _load_problems(root, DumpedProblemSummary):
         if _find_alias(alias, problem.aliases) is not None:
             candidates.append((metadata_path, problem))
 
@@ -74,7 +132,7 @@ def find_problem_by_alias(
     metadata_path = find_problem_path_by_alias(alias, root)
     if not metadata_path:
         return None
-    return DumpedProblem.model_validate_json(metadata_path.read_text())
+    return _load_problem(metadata_path)
 
 
 def find_problem_by_code(
@@ -83,11 +141,16 @@ def find_problem_by_code(
     metadata_path = find_problem_path_by_code(code, root)
     if not metadata_path:
         return None
-    return DumpedProblem.model_validate_json(metadata_path.read_text())
+    try:
+        return _load_problem(metadata_path)
+    except FileNotFoundError:
+        # Removed since it was last seen.
+        _CACHE.pop(('_is_metadata_file', os.path.abspath(metadata_path)), None)
+        return None
 
 
-def find_problem_by_anything(
-    anything: str, root: Optional[pathlib.Path] = None
+def _find_problem_by_anything(
+    anything: str, root: pathlib.Path
 ) -> Optional[DumpedProblem]:
     problem = find_problem_by_code(anything, root)
     if problem:
@@ -95,11 +158,34 @@ def find_problem_by_anything(
     return find_problem_by_alias(anything, root)
 
 
+def find_problem_by_anything(
+    anything: str, root: Optional[pathlib.Path] = None
+) -> Optional[DumpedProblem]:
+    # Keyed by the absolute root, so the same lookup is not redone when
+    # issued from different places of a single command.
+    abs_root = os.path.abspath(root or '.')
+    key = ('find_problem_by_anything', anything, abs_root)
+    problem = _CACHE.get(key)
+    if problem is None:
+        problem = _find_problem_by_anything(anything, pathlib.Path(abs_root))
+        if problem is None:
+            return None
+        _CACHE[key] = problem
+    # Callers are free to change the problem they get.
+    return problem.model_copy(deep=True)
+
+
 def find_problems(root: Optional[pathlib.Path] = None) -> List[DumpedProblem]:
     if not root:
         root = pathlib.Path()
 
-    problems = []
-    for metadata_path in root.glob('*.rbx.json'):
-        problems.append(DumpedProblem.model_validate_json(metadata_path.read_text()))
-    return problems
+    return [problem for _, problem in _load_problems(root)]
+
+
+def find_problem_summaries(
+    root: Optional[pathlib.Path] = None,
+) -> List[DumpedProblemSummary]:
+    if not root:
+        root = pathlib.Path()
+
+    return [problem for _, problem in _load_problems(root, DumpedProblemSummary)]
@@ -0,0 +1,45 @@
+import pathlib
+
+from robox import metadata, utils
+from robox.schema import Batch, DumpedProblem
+
+
+def _dump_problem(root: pathlib.Path, code: str):
+    problem = DumpedProblem(
+        name=code,
+        code=code,
+        aliases=[code.lower()],
+        memoryLimit=256,
+        timeLimit=1000,
+        batch=Batch.create(),
+    )
+    (root / f'{code}.rbx.json').write_text(utils.model_json(problem))
+
+
+def test_find_problem_by_code_sees_created_and_removed_files(tmp_path: pathlib.Path):
+    assert metadata.find_problem_by_code('A', tmp_path) is None
+
+    _dump_problem(tmp_path, 'A')
+    problem = metadata.find_problem_by_code('A', tmp_path)
+    assert problem is not None
+    assert problem.code == 'A'
+
+    (tmp_path / 'A.rbx.json').unlink()
+    assert metadata.find_problem_by_code('A', tmp_path) is None
+
+
+def test_find_problem_by_anything(tmp_path: pathlib.Path):
+    assert metadata.find_problem_by_anything('a', tmp_path) is None
+
+    _dump_problem(tmp_path, 'A')
+    problem = metadata.find_problem_by_anything('a', tmp_path)
+    assert problem is not None
+    assert problem.code == 'A'
+
+    # Changing a returned problem does not change later lookups.
+    problem.checker = 'checker.cpp'
+    problem.aliases.append('b')
+    problem = metadata.find_problem_by_anything('a', tmp_path)
+    assert problem is not None
+    assert problem.checker is None
+    assert problem.aliases == ['a']
@@ -38,6 +38,13 @@ class Problem(BaseModel):
         return utils.normalize_with_underscores(self.name)
 
 
+class DumpedProblemSummary(BaseModel):
+    # Subset of the fields of a `DumpedProblem` that is enough to look it up,
+    # and which is much cheaper to load since testcases are skipped.
+    code: str
+    aliases: List[str]
+
+
 class DumpedProblem(Problem):
     code: str
     aliases: List[str]
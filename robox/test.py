@@ -1,9 +1,12 @@
 import atexit
+import os
 import pathlib
+import re
 import tempfile
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from rich.columns import Columns
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 from rich.progress import MofNCompleteColumn, Progress, SpinnerColumn
 from rich.text import Text
@@ -17,31 +20,29 @@ from robox.grading.judge.sandboxes import stupid_sandbox
 from robox.schema import DumpedProblem, Problem
 
 
-def get_testcase_index(path: pathlib.Path) -> int:
-    return int(path.stem.split('.')[-1])
+def iterate_testcase_files(
+    code: str, root: pathlib.Path = pathlib.Path()
+) -> Iterator[Tuple[int, str, str]]:
+    # Yields the index, extension and name of every `{code}.{index}.{in,out}`
+    # file directly under root.
+    pattern = re.compile(rf'{re.escape(code)}\.(\d+)\.(in|out)')
+    with os.scandir(root) as entries:
+        for entry in entries:
+            match = pattern.fullmatch(entry.name)
+            if match is not None:
+                yield int(match.group(1)), match.group(2), entry.name
 
 
 def get_testcases_io(
     problem: DumpedProblem, root: pathlib.Path = pathlib.Path()
 ) -> List[steps.TestcaseIO]:
     testcases_per_index: Dict[int, steps.TestcaseIO] = {}
-    for input_file in root.glob(f'{problem.code}.*.in'):
-        try:
-            index = get_testcase_index(input_file)
-        except ValueError:
-            continue
-        testcases_per_index[index] = steps.TestcaseIO(index=index, input=input_file)
-
-    for output_file in root.glob(f'{problem.code}.*.out'):
-        index = get_testcase_index(output_file)
-        try:
-            index = get_testcase_index(output_file)
-        except ValueError:
-            continue
-        if index in testcases_per_index:
-            testcases_per_index[index].output = output_file
-            continue
-        testcases_per_index[index] = steps.TestcaseIO(index=index, output=output_file)
+    for index, extension, name in iterate_testcase_files(problem.code, root):
+        testcase = testcases_per_index.setdefault(index, steps.TestcaseIO(index=index))
+        if extension == 'in':
+            testcase.input = root / name
+        else:
+            testcase.output = root / name
 
     return sorted(testcases_per_index.values(), key=lambda x: x.index)
 
@@ -143,12 +144,15 @@ def _pretty_print_side_by_side(result: steps.Evaluation):
     )
 
 
+_OUTCOME_STYLES = {
+    steps.Outcome.ACCEPTED: 'success',
+    steps.Outcome.JUDGE_FAILED: 'warning',
+    steps.Outcome.INTERNAL_ERROR: 'warning',
+}
+
+
 def _get_outcome_style(outcome: steps.Outcome) -> str:
-    if outcome == steps.Outcome.ACCEPTED:
-        return 'success'
-    if outcome == steps.Outcome.JUDGE_FAILED or outcome == steps.Outcome.INTERNAL_ERROR:
-        return 'warning'
-    return 'error'
+    return _OUTCOME_STYLES.get(outcome, 'error')
 
 
 def _pretty_print_outcome_panel(
@@ -188,19 +192,24 @@ def _pretty_print_evaluation_result(
     eval: steps.Evaluation,
     interactive: bool = False,
 ):
-    console.print(_pretty_print_outcome_panel(problem, eval))
+    # Rendered as a single group, so the console is only written to once.
+    renderables: List[RenderableType] = [_pretty_print_outcome_panel(problem, eval)]
     if eval.result.outcome != steps.Outcome.ACCEPTED:
         if interactive:
-            console.print(
+            renderables.append(
                 _pretty_print_output_on_panel(eval.log.stdout_absolute_path, 'Output')
             )
         else:
-            console.print(_pretty_print_side_by_side(eval))
+            renderables.append(_pretty_print_side_by_side(eval))
         if eval.result.message:
-            console.print(
-                f'[error]Checker message:[/error] {eval.result.message.strip()}'
+            # Assembled as text, since the message is not markup.
+            renderables.append(
+                Text.assemble(
+                    ('Checker message:', 'error'), ' ', eval.result.message.strip()
+                )
             )
-    console.print()
+    renderables.append('')
+    console.print(Group(*renderables))
 
 
 def pretty_print_summary(
@@ -265,8 +274,8 @@ def main(
             output = multiline_prompt('Testcase output')
             input_path = pathlib.Path(tempfile.mktemp())
             output_path = pathlib.Path(tempfile.mktemp())
-            input_path.write_text(input)
-            output_path.write_text(output)
+            input_path.write_bytes(input.encode())
+            output_path.write_bytes(output.encode())
             testcases.append(
                 steps.TestcaseIO(
                     index=len(testcases), input=input_path, output=output_path
@@ -0,0 +1,36 @@
+import pathlib
+
+from robox.schema import Batch, DumpedProblem
+from robox.test import get_testcases_io
+
+
+def test_get_testcases_io(tmp_path: pathlib.Path):
+    problem = DumpedProblem(
+        name='A. Sum',
+        code='A',
+        aliases=['a'],
+        memoryLimit=256,
+        timeLimit=1000,
+        batch=Batch.create(),
+    )
+    for name in [
+        'A.0.in',
+        'A.0.out',
+        'A.1.in',
+        'A.2.out',
+        'A.10.in',
+        'A.in',
+        'A.x.in',
+        'A.3.ans',
+        'B.4.in',
+        'AA.5.in',
+    ]:
+        (tmp_path / name).touch()
+
+    testcases = get_testcases_io(problem, tmp_path)
+    assert [(tc.index, tc.input, tc.output) for tc in testcases] == [
+        (0, tmp_path / 'A.0.in', tmp_path / 'A.0.out'),
+        (1, tmp_path / 'A.1.in', None),
+        (2, None, tmp_path / 'A.2.out'),
+        (10, tmp_path / 'A.10.in', None),
+    ]
@@ -7,7 +7,7 @@ import rich.text
 import rich.tree
 from rich.filesize import decimal
 
-from robox import console
+from robox import cache_utils, console
 
 _TESTDATA_PKG = 'testdata'
 
@@ -20,14 +20,7 @@ def get_testdata_path() -> pathlib.Path:
 
 
 def clear_all_functools_cache():
-    from robox.box import environment, package
-
-    pkgs = [environment, package]
-
-    for pkg in pkgs:
-        for fn in pkg.__dict__.values():
-            if hasattr(fn, 'cache_clear'):
-                fn.cache_clear()
+    cache_utils.clear_all()
 
 
 def walk_directory(directory: pathlib.Path, tree: rich.tree.Tree) -> None:
@@ -1,8 +1,15 @@
 import fcntl
+import glob
 import json
+import os
 import pathlib
+import re
 import resource
-from typing import Any, Optional, Type, TypeVar
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import rich
 import rich.prompt
@@ -13,17 +20,66 @@ from pydantic import BaseModel
 from rich import text
 from rich.highlighter import JSONHighlighter
 
+from robox import cache_utils
 from robox.console import console
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
 T = TypeVar('T', bound=BaseModel)
 APP_NAME = 'robox'
 
+_CACHE: Dict[Any, Any] = {}
+
+_UNDERSCORE_TRANSLATION = str.maketrans(' .', '__')
+_UNDERSCORES_PATTERN = re.compile(r'_+')
+
 
 def create_and_write(path: pathlib.Path, *args, **kwargs):
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(*args, **kwargs)
 
 
+def write_atomically(path: pathlib.Path, content: bytes):
+    # Write to a temporary file in the same directory and move it over the
+    # destination, so concurrent readers never see a partially written file.
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        pathlib.Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def _rmtrees(paths: List[pathlib.Path]):
+    for path in paths:
+        shutil.rmtree(str(path), ignore_errors=True)
+
+
+def rmtree_in_background(path: pathlib.Path | str):
+    # Move the directory out of the way, which is instant, and delete it in
+    # another thread so the caller can reuse the path right away. The thread
+    # does not hold the process on exit, so directories it did not get to
+    # remove are swept by the next call for the same path.
+    path = pathlib.Path(path)
+    to_remove = list(path.parent.glob(f'{glob.escape(path.name)}.__gc_*'))
+    if path.exists():
+        temp_path = path.with_name(f'{path.name}.__gc_{os.getpid()}_{time.time_ns()}')
+        try:
+            path.rename(temp_path)
+            to_remove.append(temp_path)
+        except OSError:
+            shutil.rmtree(str(path), ignore_errors=True)
+    if not to_remove:
+        return
+    threading.Thread(target=_rmtrees, args=(to_remove,), daemon=True).start()
+
+
 def highlight_str(s: str) -> text.Text:
     txt = text.Text(s)
     JSONHighlighter().highlight(txt)
@@ -36,16 +92,8 @@ def highlight_json_obj(obj: Any) -> text.Text:
 
 
 def normalize_with_underscores(s: str) -> str:
-    res = s.replace(' ', '_').replace('.', '_').strip('_')
-    final = []
-
-    last = ''
-    for c in res:
-        if c == '_' and last == c:
-            continue
-        last = c
-        final.append(c)
-    return ''.join(final)
+    res = s.translate(_UNDERSCORE_TRANSLATION).strip('_')
+    return _UNDERSCORES_PATTERN.sub('_', res)
 
 
 def get_app_path() -> pathlib.Path:
@@ -53,6 +101,8 @@ def get_app_path() -> pathlib.Path:
     return pathlib.Path(app_dir)
 
 
+# Schemas only change across versions, so they are written once per process.
+@cache_utils.memoize(_CACHE)
 def ensure_schema(model: Type[BaseModel]) -> pathlib.Path:
     path = get_app_path() / 'schemas' / f'{model.__name__}.json'
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -70,13 +120,14 @@ def model_to_yaml(model: BaseModel) -> str:
     path = ensure_schema(model.__class__)
     return f'# yaml-language-server: $schema={path}\n\n' + yaml.dump(
         model.model_dump(mode='json', exclude_unset=True, exclude_none=True),
+        Dumper=SafeDumper,
         sort_keys=False,
     )
 
 
-def model_from_yaml(model: Type[T], s: str) -> T:
+def model_from_yaml(model: Type[T], s: str | bytes) -> T:
     ensure_schema(model)
-    return model(**yaml.safe_load(s))
+    return model(**yaml.load(s, Loader=SafeLoader))
 
 
 def confirm_on_status(status: Optional[rich.status.Status], *args, **kwargs) -> bool:
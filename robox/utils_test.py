@@ -0,0 +1,25 @@
+import pathlib
+import time
+
+from robox.utils import normalize_with_underscores, rmtree_in_background
+
+
+def test_normalize_with_underscores():
+    assert normalize_with_underscores('A. Sum of Two') == 'A_Sum_of_Two'
+    assert normalize_with_underscores('__a__b..c  ') == 'a_b_c'
+    assert normalize_with_underscores('') == ''
+
+
+def test_rmtree_in_background(tmp_path: pathlib.Path):
+    build = tmp_path / 'build'
+    (build / 'sub').mkdir(parents=True)
+    # Leftover of an interrupted previous call.
+    (tmp_path / 'build.__gc_1_1' / 'sub').mkdir(parents=True)
+    (tmp_path / 'build2').mkdir()
+
+    rmtree_in_background(build)
+    assert not build.exists()
+    deadline = time.monotonic() + 10
+    while len(list(tmp_path.iterdir())) > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [path.name for path in tmp_path.iterdir()] == ['build2']